@@ -13,7 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.io import load_artifact
 from src.config import AWARDS
 from src.ui_components import (
-    inject_custom_css, render_hero_section, render_award_card, render_sidebar_toggle
+    escape_html, inject_custom_css, render_hero_section, render_award_card, render_sidebar_toggle
 )
 
 # Page config
@@ -70,7 +70,7 @@ def show_home(leaderboard: pd.DataFrame):
     
     top_awards_list = []
     for award in AWARDS[:3]:
-        award_id = award["id"]
+        award_id = award.id
         award_data = leaderboard[
             (leaderboard["award_id"] == award_id) & 
             (leaderboard["rank"] == 1)
@@ -91,15 +91,15 @@ def show_home(leaderboard: pd.DataFrame):
             winner = item["winner"]
             
             card_html = render_award_card(
-                award_icon=award.get("icon", "🏆"),
-                award_title=award["title"],
+                award_icon=award.icon,
+                award_title=award.title,
                 player_name=winner["player_name_ko"],
                 team_name=winner["team_name_ko"],
                 metric_value=winner["score"],
                 metric_label="점수",
                 rank=int(winner["rank"]),
                 percentile=winner.get("percentile"),
-                description=f"{award['description']} 이번 시즌 {winner['player_name_ko']} 선수가 가장 눈에 띄었습니다.",
+                description=f"{award.description} 이번 시즌 {escape_html(winner['player_name_ko'])} 선수가 가장 눈에 띄었습니다.",
                 is_large=True
             )
             st.markdown(card_html, unsafe_allow_html=True)
@@ -113,11 +113,11 @@ def show_home(leaderboard: pd.DataFrame):
         with award_cols[idx % 3]:
             award_html = f"""
             <div class="award-card" style="padding: 20px;">
-                <div style="font-size: 2rem; margin-bottom: 12px;">{award.get('icon', '🏆')}</div>
-                <div class="award-title" style="font-size: 1.2rem;">{award['title']}</div>
-                <div class="award-subtext">{award['description']}</div>
+                <div style="font-size: 2rem; margin-bottom: 12px;">{award.icon}</div>
+                <div class="award-title" style="font-size: 1.2rem;">{award.title}</div>
+                <div class="award-subtext">{award.description}</div>
                 <div style="margin-top: 12px;">
-                    <span class="badge badge-percentile">{award['category']}</span>
+                    <span class="badge badge-percentile">{award.category}</span>
                 </div>
             </div>
             """
@@ -9,11 +9,11 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.io import load_artifact
-from src.config import AWARDS
+from src.config import AWARDS_BY_ID
 from src.ui_components import (
-    inject_custom_css, render_profile_header, render_award_card, 
+    escape_html, inject_custom_css, render_profile_header, render_award_card, 
     render_stat_card, render_small_award_card, render_player_vs_header,
-    render_metric_comparison, render_sidebar_toggle
+    render_metric_comparison, render_award_grid, render_sidebar_toggle
 )
 from src.text_templates import generate_player_description
 
@@ -53,10 +53,7 @@ player_zone_activity = load_zone_activity()
 # Helper functions
 def get_award_info(award_id):
     """Get award config by ID"""
-    for award in AWARDS:
-        if award["id"] == award_id:
-            return award
-    return None
+    return AWARDS_BY_ID.get(award_id)
 
 def fmt_score(x):
     try:
@@ -117,7 +114,9 @@ with tab_profile:
         st.warning("검색 결과가 없습니다.")
     else:
         # Player selection
-        player_names = (filtered_players["player_name_ko"] + " (" + filtered_players["team_name_ko"] + ")").tolist()
+        player_names = (
+            filtered_players["player_name_ko"].astype(str) + " (" + filtered_players["team_name_ko"].astype(str) + ")"
+        ).tolist()
         selected_player_idx = st.selectbox("선수 선택", range(len(player_names)), 
                                           format_func=lambda x: player_names[x],
                                           key="player_select")
@@ -135,10 +134,10 @@ with tab_profile:
             if len(player_awards) > 0:
                 top_award = player_awards.iloc[0]
                 top_award_info = get_award_info(top_award["award_id"])
-                summary = f"이번 시즌 {player_name} 선수는 '{top_award_info['title'] if top_award_info else '이그노벨상'}'에서 #{int(top_award['rank'])}위를 기록했습니다. "
+                summary = f"이번 시즌 {escape_html(player_name)} 선수는 '{top_award_info.title if top_award_info else '이그노벨상'}'에서 #{int(top_award['rank'])}위를 기록했습니다. "
                 summary += f"총 {len(player_awards)}개의 상에 이름을 올렸으며, 데이터가 말하는 수비 패턴이 눈에 띕니다."
             else:
-                summary = f"{player_name} 선수의 이그노벨상 수상 내역을 확인할 수 있습니다."
+                summary = f"{escape_html(player_name)} 선수의 이그노벨상 수상 내역을 확인할 수 있습니다."
 
             # Profile Header
             profile_html = render_profile_header(player_name, team_name, summary)
@@ -206,15 +205,15 @@ with tab_profile:
                             award_info = get_award_info(award_row["award_id"])
                             if award_info:
                                 card_html = render_award_card(
-                                    award_icon=award_info.get("icon", "🏆"),
-                                    award_title=award_info["title"],
+                                    award_icon=award_info.icon,
+                                    award_title=award_info.title,
                                     player_name=player_name,
                                     team_name=team_name,
                                     metric_value=award_row["score"],
                                     metric_label="점수",
                                     rank=int(award_row["rank"]),
                                     percentile=award_row.get("percentile"),
-                                    description=award_info["description"],
+                                    description=award_info.description,
                                     is_large=False
                                 )
                                 st.markdown(card_html, unsafe_allow_html=True)
@@ -222,25 +221,19 @@ with tab_profile:
                 # All Awards List
                 st.markdown('<div class="section-title" style="margin-top: 40px;">📋 전체 수상 내역</div>', unsafe_allow_html=True)
 
-                rows = (len(player_awards) + 1) // 2
-                for i in range(rows):
-                    cols = st.columns(2)
-                    for j in range(2):
-                        idx = i * 2 + j
-                        if idx < len(player_awards):
-                            with cols[j]:
-                                award_row = player_awards.iloc[idx]
-                                award_info = get_award_info(award_row["award_id"])
-                                if award_info:
-                                    card_html = render_small_award_card(
-                                        award_icon=award_info.get("icon", "🏆"),
-                                        award_title=award_info["title"],
-                                        player_name=player_name,
-                                        team_name=team_name,
-                                        rank=int(award_row["rank"]),
-                                        score=award_row["score"]
-                                    )
-                                    st.markdown(card_html, unsafe_allow_html=True)
+                award_cards = []
+                for _, award_row in player_awards.iterrows():
+                    award_info = get_award_info(award_row["award_id"])
+                    if award_info:
+                        award_cards.append(render_small_award_card(
+                            award_icon=award_info.icon,
+                            award_title=award_info.title,
+                            player_name=player_name,
+                            team_name=team_name,
+                            rank=int(award_row["rank"]),
+                            score=award_row["score"]
+                        ))
+                render_award_grid(award_cards, columns=2)
 
                 # Detailed Description
                 st.markdown('<div class="section-title" style="margin-top: 40px;">📝 상세 분석</div>', unsafe_allow_html=True)
@@ -248,7 +241,7 @@ with tab_profile:
                 selected_award_for_detail = st.selectbox(
                     "자세히 볼 상 선택",
                     player_awards["award_id"].tolist(),
-                    format_func=lambda x: next((a["title"] for a in AWARDS if a["id"] == x), x),
+                    format_func=lambda x: AWARDS_BY_ID[x].title if x in AWARDS_BY_ID else x,
                     key="detail_award"
                 )
 
@@ -256,8 +249,8 @@ with tab_profile:
                 player_stats = selected_player.to_dict()
 
                 description = generate_player_description(
-                    player_name,
-                    team_name,
+                    escape_html(player_name),
+                    escape_html(team_name),
                     selected_award_for_detail,
                     award_detail["score"],
                     int(award_detail["rank"]),
@@ -334,8 +327,8 @@ with tab_compare:
         comp["diff"] = comp["pctl_1"] - comp["pctl_2"]
 
         # Add award titles
-        comp["award_title"] = comp["award_id"].apply(lambda x: get_award_info(x)["title"] if get_award_info(x) else x)
-        comp["award_icon"] = comp["award_id"].apply(lambda x: get_award_info(x).get("icon", "🏆") if get_award_info(x) else "🏆")
+        comp["award_title"] = comp["award_id"].apply(lambda x: get_award_info(x).title if get_award_info(x) else x)
+        comp["award_icon"] = comp["award_id"].apply(lambda x: get_award_info(x).icon if get_award_info(x) else "🏆")
 
         # Comparison mode selection
         st.markdown('<div class="section-title">📊 비교 모드</div>', unsafe_allow_html=True)
@@ -362,13 +355,14 @@ with tab_compare:
         st.markdown('<div class="section-title">⚔️ 상별 비교</div>', unsafe_allow_html=True)
         
         rows_for_summary = []
+        metric_cards = []
         for _, r in show.iterrows():
             if r["diff"] > 3:
                 worse = "right"  # player 2 is worse (player 1 has higher percentile)
-                worse_name = p2
+                worse_name = escape_html(p2)
             elif r["diff"] < -3:
                 worse = "left"  # player 1 is worse
-                worse_name = p1
+                worse_name = escape_html(p1)
             else:
                 worse = "tie"
                 worse_name = "두 선수 비슷"
@@ -381,7 +375,7 @@ with tab_compare:
                 "worse_name": worse_name,
             })
 
-            metric_html = render_metric_comparison(
+            metric_cards.append(render_metric_comparison(
                 award_title=r["award_title"],
                 award_icon=r["award_icon"],
                 player1_score=r["score_1"],
@@ -391,8 +385,8 @@ with tab_compare:
                 player2_percentile=r["pctl_2"],
                 player2_rank=int(r["rank_2"]) if r["rank_2"] < 999 else 999,
                 worse_side=worse
-            )
-            st.markdown(metric_html, unsafe_allow_html=True)
+            ))
+        render_award_grid(metric_cards)
 
         # Story summary
         st.markdown('<div class="section-title">📝 비교 요약</div>', unsafe_allow_html=True)
@@ -420,46 +414,42 @@ with tab_compare:
 
         with left:
             top5_p1 = pick_top_awards_for_player(df1, topk=5)
-            st.markdown(f'<div class="award-card"><div class="award-title">{p1}</div>', unsafe_allow_html=True)
+            top5_chunks = [f'<div class="award-card"><div class="award-title">{escape_html(p1)}</div>']
             for _, r in top5_p1.iterrows():
                 award_info = get_award_info(r["award_id"])
                 if award_info:
                     rank_emoji = "🥇" if r["rank"] == 1 else "🥈" if r["rank"] == 2 else "🥉" if r["rank"] == 3 else f"#{int(r['rank'])}"
-                    st.markdown(
-                        f"""
-                        <div style="margin-bottom: 12px; padding-bottom: 12px; border-bottom: 1px solid #30363d;">
-                            <div style="font-weight: 600; color: #f8f9fa; margin-bottom: 4px;">
-                                {award_info.get('icon', '🏆')} {award_info['title']}
-                            </div>
-                            <div style="font-size: 0.9rem; color: #8b949e;">
-                                <span class="badge badge-rank">{rank_emoji}</span>
-                                점수: {fmt_score(r['score'])} · {fmt_pct(r['percentile'])}
-                            </div>
+                    top5_chunks.append(f"""
+                    <div style="margin-bottom: 12px; padding-bottom: 12px; border-bottom: 1px solid #30363d;">
+                        <div style="font-weight: 600; color: #f8f9fa; margin-bottom: 4px;">
+                            {award_info.icon} {award_info.title}
                         </div>
-                        """,
-                        unsafe_allow_html=True
-                    )
-            st.markdown("</div>", unsafe_allow_html=True)
+                        <div style="font-size: 0.9rem; color: #8b949e;">
+                            <span class="badge badge-rank">{rank_emoji}</span>
+                            점수: {fmt_score(r['score'])} · {fmt_pct(r['percentile'])}
+                        </div>
+                    </div>
+                    """)
+            top5_chunks.append("</div>")
+            render_award_grid(top5_chunks)
 
         with right:
             top5_p2 = pick_top_awards_for_player(df2, topk=5)
-            st.markdown(f'<div class="award-card"><div class="award-title">{p2}</div>', unsafe_allow_html=True)
+            top5_chunks = [f'<div class="award-card"><div class="award-title">{escape_html(p2)}</div>']
             for _, r in top5_p2.iterrows():
                 award_info = get_award_info(r["award_id"])
                 if award_info:
                     rank_emoji = "🥇" if r["rank"] == 1 else "🥈" if r["rank"] == 2 else "🥉" if r["rank"] == 3 else f"#{int(r['rank'])}"
-                    st.markdown(
-                        f"""
-                        <div style="margin-bottom: 12px; padding-bottom: 12px; border-bottom: 1px solid #30363d;">
-                            <div style="font-weight: 600; color: #f8f9fa; margin-bottom: 4px;">
-                                {award_info.get('icon', '🏆')} {award_info['title']}
-                            </div>
-                            <div style="font-size: 0.9rem; color: #8b949e;">
-                                <span class="badge badge-rank">{rank_emoji}</span>
-                                점수: {fmt_score(r['score'])} · {fmt_pct(r['percentile'])}
-                            </div>
+                    top5_chunks.append(f"""
+                    <div style="margin-bottom: 12px; padding-bottom: 12px; border-bottom: 1px solid #30363d;">
+                        <div style="font-weight: 600; color: #f8f9fa; margin-bottom: 4px;">
+                            {award_info.icon} {award_info.title}
                         </div>
-                        """,
-                        unsafe_allow_html=True
-                    )
-            st.markdown("</div>", unsafe_allow_html=True)
+                        <div style="font-size: 0.9rem; color: #8b949e;">
+                            <span class="badge badge-rank">{rank_emoji}</span>
+                            점수: {fmt_score(r['score'])} · {fmt_pct(r['percentile'])}
+                        </div>
+                    </div>
+                    """)
+            top5_chunks.append("</div>")
+            render_award_grid(top5_chunks)
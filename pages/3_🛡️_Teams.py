@@ -3,21 +3,31 @@ Teams Page - Team comparison and analysis (Report Card Style)
 """
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.io import load_artifact
-from src.config import AWARDS
-from src.ui_components import inject_custom_css, render_comparison_card, render_stat_card, render_sidebar_toggle
+from src.config import AWARDS, AWARDS_BY_ID, AWARDS_DF, awards_by_category
+from src.ui_components import (
+    escape_html, inject_custom_css, render_award_grid, render_comparison_card, render_stat_card, render_sidebar_toggle
+)
 
 # Load zone data
 @st.cache_data
 def load_team_zone_data():
     try:
-        team_zone = load_artifact("team_zone_profile.parquet")
-        league_avg = load_artifact("league_zone_average.parquet")
+        team_zone = load_artifact(
+            "team_zone_profile.parquet",
+            columns=["team_name_ko", "zone", "event_count"]
+        )
+        league_avg = load_artifact(
+            "league_zone_average.parquet",
+            columns=["zone", "league_count"]
+        )
+        team_zone["team_name_ko"] = team_zone["team_name_ko"].astype("category")
         return team_zone, league_avg
     except FileNotFoundError:
         return pd.DataFrame(), pd.DataFrame()
@@ -37,11 +47,17 @@ st.title("🛡️ Teams")
 # Load data
 @st.cache_data
 def load_team_data():
-    leaderboard = load_artifact("leaderboard.parquet")
+    leaderboard = load_artifact(
+        "leaderboard.parquet",
+        columns=["team_name_ko", "player_id", "player_name_ko", "award_id", "rank", "score"]
+    )
     team_stats = load_artifact("awards_team.parquet")
-    return leaderboard, team_stats
+    league_award_means = load_artifact("league_award_means.parquet")
+    # Sorted team categories double as the team list; filters compare int codes
+    leaderboard["team_name_ko"] = leaderboard["team_name_ko"].astype("category")
+    return leaderboard, team_stats, league_award_means
 
-leaderboard, team_stats = load_team_data()
+leaderboard, team_stats, league_award_means = load_team_data()
 team_zone_profile, league_zone_avg = load_team_zone_data()
 
 # Team selection
@@ -49,7 +65,7 @@ col_sidebar, col_main = st.columns([1, 4])
 
 with col_sidebar:
     st.markdown("### 팀 선택")
-    teams = sorted(leaderboard["team_name_ko"].unique().tolist())
+    teams = leaderboard["team_name_ko"].cat.categories.tolist()
     selected_team = st.selectbox("팀", teams, key="team_select")
 
 # Filter team data
@@ -63,9 +79,9 @@ with col_main:
     # Team Header
     team_header_html = f"""
     <div class="profile-header">
-        <div class="profile-name">{selected_team}</div>
+        <div class="profile-name">{escape_html(selected_team)}</div>
         <div class="profile-summary" style="font-size: 1rem;">
-            이번 시즌 {selected_team}의 이그노벨상 수상 현황과 리그 평균 대비 분석입니다.
+            이번 시즌 {escape_html(selected_team)}의 이그노벨상 수상 현황과 리그 평균 대비 분석입니다.
         </div>
     </div>
     """
@@ -76,9 +92,10 @@ with col_main:
     
     stats_cols = st.columns(4)
     
-    team_player_count = len(team_players["player_id"].unique())
-    team_award_count = len(team_players[team_players["rank"] <= 3])
-    team_top1_count = len(team_players[team_players["rank"] == 1])
+    ranks = team_players["rank"].to_numpy()
+    team_player_count = team_players["player_id"].nunique()
+    team_award_count = int((ranks <= 3).sum())
+    team_top1_count = int((ranks == 1).sum())
     avg_score = team_players["score"].mean()
     
     with stats_cols[0]:
@@ -97,48 +114,52 @@ with col_main:
         team_zone_data = team_zone_profile[team_zone_profile["team_name_ko"] == selected_team].copy()
         
         if len(team_zone_data) > 0:
-            # Aggregate by zone
-            team_zones_agg = team_zone_data.groupby("zone").agg({
-                "event_count": "sum"
-            }).reset_index().sort_values("event_count", ascending=False)
+            # Aggregate by zone: the ETL writes the artifact sorted by (team, zone),
+            # so each zone is a contiguous run and can be summed with reduceat (no
+            # hashing). A stale or hand-built artifact falls back to a groupby.
+            if team_zone_data["zone"].is_monotonic_increasing:
+                zones, run_starts = np.unique(team_zone_data["zone"].to_numpy(), return_index=True)
+                zone_sums = np.add.reduceat(team_zone_data["event_count"].to_numpy(), run_starts)
+            else:
+                zone_totals = team_zone_data.groupby("zone", sort=True, observed=True)["event_count"].sum()
+                zones, zone_sums = zone_totals.index.to_numpy(), zone_totals.to_numpy()
+            top_idx = np.argsort(-zone_sums, kind="stable")[:3]
+            team_zones_agg = pd.DataFrame({"zone": zones[top_idx], "event_count": zone_sums[top_idx]})
             
-            top3_zones = team_zones_agg.head(3)
+            # League value for comparison: first league row per zone, joined once
+            league_zone_first = league_zone_avg.drop_duplicates("zone")[["zone", "league_count"]]
+            top3_zones = team_zones_agg.merge(
+                league_zone_first, on="zone", how="left"
+            ).fillna({"league_count": 0})
             
-            pattern_cols = st.columns(3)
-            for idx, (_, zone_row) in enumerate(top3_zones.iterrows()):
-                with pattern_cols[idx]:
-                    # Get league average for comparison
-                    league_val = 0
-                    if len(league_zone_avg) > 0:
-                        league_match = league_zone_avg[league_zone_avg["zone"] == zone_row["zone"]]
-                        if len(league_match) > 0:
-                            league_val = league_match["league_count"].iloc[0]
-                    
-                    diff = zone_row["event_count"] - league_val
-                    diff_class = "better" if diff > 0 else "worse"
-                    
-                    zone_html = f"""
-                    <div class="award-card" style="padding: 16px; text-align: center;">
-                        <div class="award-title" style="font-size: 1.2rem; margin-bottom: 8px;">
-                            {zone_row['zone']}
-                        </div>
-                        <div class="award-metric" style="font-size: 1.5rem;">
-                            {zone_row['event_count']:.0f}
-                        </div>
-                        <div class="award-subtext" style="font-size: 0.85rem;">
-                            이벤트 수<br>
-                            리그 평균: {league_val:.0f}
-                        </div>
-                        <div class="{diff_class}" style="font-size: 0.9rem; margin-top: 8px;">
-                            ({'+' if diff > 0 else ''}{diff:.0f})
-                        </div>
+            zone_cards = []
+            for zone_row in top3_zones.itertuples(index=False):
+                league_val = zone_row.league_count
+                diff = zone_row.event_count - league_val
+                diff_class = "better" if diff > 0 else "worse"
+                
+                zone_cards.append(f"""
+                <div class="award-card" style="padding: 16px; text-align: center;">
+                    <div class="award-title" style="font-size: 1.2rem; margin-bottom: 8px;">
+                        {zone_row.zone}
                     </div>
-                    """
-                    st.markdown(zone_html, unsafe_allow_html=True)
+                    <div class="award-metric" style="font-size: 1.5rem;">
+                        {zone_row.event_count:.0f}
+                    </div>
+                    <div class="award-subtext" style="font-size: 0.85rem;">
+                        이벤트 수<br>
+                        리그 평균: {league_val:.0f}
+                    </div>
+                    <div class="{diff_class}" style="font-size: 0.9rem; margin-top: 8px;">
+                        ({'+' if diff > 0 else ''}{diff:.0f})
+                    </div>
+                </div>
+                """)
+            render_award_grid(zone_cards, columns=3)
             
             # Pattern summary text
             top_zone = top3_zones.iloc[0]
-            pattern_summary = f"**{selected_team}**은(는) **{top_zone['zone']}**에서 가장 많은 활동을 보입니다. "
+            pattern_summary = f"**{escape_html(selected_team)}**은(는) **{top_zone['zone']}**에서 가장 많은 활동을 보입니다. "
             
             pattern_html = f"""
             <div class="award-card" style="margin-top: 20px; padding: 16px;">
@@ -152,87 +173,86 @@ with col_main:
     # Category Filter
     st.markdown('<div class="section-title">📋 카테고리별 성과</div>', unsafe_allow_html=True)
     
-    categories = ["전체"] + list(set(a["category"] for a in AWARDS))
+    categories = ["전체"] + AWARDS_DF["category"].unique().tolist()
     selected_category = st.selectbox("카테고리", categories, key="team_category")
     
     if selected_category == "전체":
-        category_awards = AWARDS
+        category_award_ids = AWARDS_DF.index
     else:
-        category_awards = [a for a in AWARDS if a["category"] == selected_category]
+        category_award_ids = awards_by_category(selected_category).index
     
-    team_category_data = team_players[team_players["award_id"].isin([a["id"] for a in category_awards])]
+    team_category_data = team_players[team_players["award_id"].isin(category_award_ids)]
     
     if len(team_category_data) > 0:
         # Top Players in Category
         top_players = team_category_data.nsmallest(10, "rank")
+        records = list(top_players.itertuples(index=False))
         
         st.markdown("#### Top 10 선수")
         
-        rows = (len(top_players) + 1) // 2
-        for i in range(rows):
-            cols = st.columns(2)
-            for j in range(2):
-                idx = i * 2 + j
-                if idx < len(top_players):
-                    with cols[j]:
-                        player_row = top_players.iloc[idx]
-                        award_info = next((a for a in AWARDS if a["id"] == player_row["award_id"]), None)
-                        award_title = award_info["title"] if award_info else "상"
-                        
-                        card_html = f"""
-                        <div class="award-card" style="padding: 16px;">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <div>
-                                    <div style="font-size: 0.9rem; color: #8b949e; margin-bottom: 4px;">
-                                        {award_title}
-                                    </div>
-                                    <div style="font-size: 1.1rem; color: #f8f9fa; font-weight: 600;">
-                                        {player_row["player_name_ko"]}
-                                    </div>
-                                </div>
-                                <div style="text-align: right;">
-                                    <div class="badge badge-rank" style="font-size: 1rem;">
-                                        #{int(player_row["rank"])}
-                                    </div>
-                                    <div style="font-size: 1rem; color: #facc15; font-weight: 700; margin-top: 4px;">
-                                        {player_row["score"]:.3f}
-                                    </div>
-                                </div>
-                            </div>
+        top_cards = []
+        for player_row in records:
+            award_info = AWARDS_BY_ID.get(player_row.award_id)
+            award_title = award_info.title if award_info else "상"
+            
+            top_cards.append(f"""
+            <div class="award-card" style="padding: 16px;">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <div style="font-size: 0.9rem; color: #8b949e; margin-bottom: 4px;">
+                            {award_title}
                         </div>
-                        """
-                        st.markdown(card_html, unsafe_allow_html=True)
+                        <div style="font-size: 1.1rem; color: #f8f9fa; font-weight: 600;">
+                            {escape_html(player_row.player_name_ko)}
+                        </div>
+                    </div>
+                    <div style="text-align: right;">
+                        <div class="badge badge-rank" style="font-size: 1rem;">
+                            #{int(player_row.rank)}
+                        </div>
+                        <div style="font-size: 1rem; color: #facc15; font-weight: 700; margin-top: 4px;">
+                            {player_row.score:.3f}
+                        </div>
+                    </div>
+                </div>
+            </div>
+            """)
+        render_award_grid(top_cards, columns=2)
     
     # Team vs League Comparison
     st.markdown('<div class="section-title" style="margin-top: 40px;">📈 리그 평균 대비</div>', unsafe_allow_html=True)
     
+    # Team per-award means in one groupby pass; league means are precomputed
+    team_means = team_players.groupby("award_id", sort=False, observed=True)["score"].mean()
+    league_means = league_award_means.set_index("award_id")["league_avg_score"]
+    award_means = pd.concat(
+        [team_means, league_means], axis=1, keys=["team_avg", "league_avg"]
+    ).dropna()
+    award_means["diff"] = award_means["team_avg"] - award_means["league_avg"]
+    
     comparison_data = []
     for award in AWARDS:
-        award_id = award["id"]
-        team_award_data = team_players[team_players["award_id"] == award_id]
-        league_award_data = leaderboard[leaderboard["award_id"] == award_id]
+        if award.id not in award_means.index:
+            continue
         
-        if len(team_award_data) > 0 and len(league_award_data) > 0:
-            team_avg = team_award_data["score"].mean()
-            league_avg = league_award_data["score"].mean()
-            
-            comparison_data.append({
-                "award_title": award["title"],
-                "team_avg": team_avg,
-                "league_avg": league_avg,
-                "diff": team_avg - league_avg
-            })
+        means = award_means.loc[award.id]
+        comparison_data.append({
+            "award_title": award.title,
+            "team_avg": means["team_avg"],
+            "league_avg": means["league_avg"],
+            "diff": means["diff"]
+        })
     
     if comparison_data:
         # Display as cards in grid
-        comp_cols = st.columns(3)
-        for idx, comp in enumerate(comparison_data):
-            with comp_cols[idx % 3]:
-                comparison_html = render_comparison_card(
-                    label=comp["award_title"],
-                    team_value=comp["team_avg"],
-                    league_value=comp["league_avg"]
-                )
-                st.markdown(comparison_html, unsafe_allow_html=True)
+        comparison_cards = [
+            render_comparison_card(
+                label=comp["award_title"],
+                team_value=comp["team_avg"],
+                league_value=comp["league_avg"]
+            )
+            for comp in comparison_data
+        ]
+        render_award_grid(comparison_cards, columns=3)
     else:
         st.info("비교 데이터가 없습니다.")
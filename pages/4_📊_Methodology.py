@@ -30,23 +30,23 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Award Explanations
-for award in AWARDS:
-    award_card_html = f"""
+# Award Explanations (one markdown element for all cards)
+def award_card_html(award):
+    return f"""
     <div class="award-card-large" style="margin-bottom: 32px;">
         <div class="award-title-large">
-            {award['icon']} {award['title']}
+            {award.icon} {award.title}
         </div>
         <div style="margin-top: 16px;">
-            <span class="badge badge-percentile">{award['category']}</span>
-            <span class="badge badge-percentile">최소 {award.get('min_attempts', 0)}회 시도</span>
+            <span class="badge badge-percentile">{award.category}</span>
+            <span class="badge badge-percentile">최소 {award.min_attempts}회 시도</span>
         </div>
         <div class="award-subtext" style="font-size: 1.1rem; margin-top: 20px; color: #c9d1d9;">
-            {award['description']}
+            {award.description}
         </div>
         <div class="formula-box" style="margin-top: 24px;">
             <strong style="color: #facc15;">공식:</strong> 
-            <code style="color: #c9d1d9;">{award['formula']}</code>
+            <code style="color: #c9d1d9;">{award.formula}</code>
         </div>
         <div style="margin-top: 20px; padding: 16px; background: #0e1117; border-radius: 8px; border-left: 4px solid #30363d;">
             <div style="font-size: 0.95rem; color: #8b949e; line-height: 1.6;">
@@ -55,8 +55,10 @@ for award in AWARDS:
             </div>
         </div>
     </div>
-    """
-    st.markdown(award_card_html, unsafe_allow_html=True)
+    """.strip()
+
+
+st.markdown("\n".join(award_card_html(a) for a in AWARDS), unsafe_allow_html=True)
 
 # General Methodology
 st.markdown('<div class="section-title">📈 점수 계산 방법</div>', unsafe_allow_html=True)
@@ -84,8 +86,8 @@ methodology_steps = [
     }
 ]
 
-for step_info in methodology_steps:
-    step_html = f"""
+def step_card_html(step_info):
+    return f"""
     <div class="award-card" style="margin-bottom: 20px;">
         <div style="display: flex; align-items: start;">
             <div style="font-size: 2rem; font-weight: 700; color: #facc15; margin-right: 20px; min-width: 60px;">
@@ -101,8 +103,10 @@ for step_info in methodology_steps:
             </div>
         </div>
     </div>
-    """
-    st.markdown(step_html, unsafe_allow_html=True)
+    """.strip()
+
+
+st.markdown("\n".join(step_card_html(s) for s in methodology_steps), unsafe_allow_html=True)
 
 # 이그노벨 ↔ 공간패턴 연결 논리
 st.markdown('<div class="section-title" style="margin-top: 40px;">🎯 이그노벨상과 공간 패턴의 연결</div>', unsafe_allow_html=True)
@@ -4,19 +4,20 @@ Day 2: Pitch maps for teams, players, and Ignobel winners
 """
 import streamlit as st
 import pandas as pd
+import pyarrow.compute as pc
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.io import load_artifact
+from src.io import load_artifact, load_artifact_dataset
 from src.config import AWARDS
-from src.ui_components import inject_custom_css, render_sidebar_toggle
+from src.ui_components import escape_html, inject_custom_css, render_sidebar_toggle
 from src.pitch_utils import (
     draw_pitch_plotly, plot_events_scatter, plot_events_heatmap, plot_zone_activity
 )
 import plotly.graph_objects as go
-import plotly.express as px
+from plotly.colors import qualitative
 
 st.set_page_config(
     page_title="Pitch Analysis | K League 이그노벨상",
@@ -45,11 +46,114 @@ st.markdown("""
 # Load data
 @st.cache_data
 def load_pitch_data():
-    events_light = load_artifact("events_light.parquet")
-    player_zone = load_artifact("player_zone_activity.parquet")
-    leaderboard = load_artifact("leaderboard.parquet")
+    events_light = load_artifact(
+        "events_light.parquet",
+        columns=["team_name_ko", "player_name_ko", "player_id", "start_x", "start_y",
+                 "type_name", "is_success"]
+    )
+    player_zone = load_artifact(
+        "player_zone_activity.parquet",
+        columns=["player_name_ko", "zone", "type_name", "event_count"]
+    )
+    leaderboard = load_artifact(
+        "leaderboard.parquet",
+        columns=["award_id", "player_id", "player_name_ko", "team_name_ko", "rank", "score"]
+    )
+    # Categorical names: dropdown lists come from the categories, not a row scan
+    for col in ("team_name_ko", "player_name_ko", "type_name"):
+        events_light[col] = events_light[col].astype("category")
+    # Narrow numerics: halves what Plotly serializes per point
+    for col in ("start_x", "start_y"):
+        events_light[col] = events_light[col].astype("float32")
+    leaderboard["rank"] = leaderboard["rank"].astype("int16")
     return events_light, player_zone, leaderboard
 
+
+@st.cache_data
+def list_teams(_events_light):
+    return sorted(_events_light["team_name_ko"].cat.categories.tolist())
+
+
+@st.cache_data
+def list_players(_events_light):
+    return sorted(_events_light["player_name_ko"].cat.categories.tolist())
+
+
+@st.cache_resource
+def winners_index(_leaderboard):
+    """award_id -> that award's leaderboard rows sorted by rank (read-only, shared)"""
+    # Stable sort keeps tied winners in leaderboard order (and so their colors)
+    return {
+        award_id: award_rows.sort_values("rank", kind="stable")
+        for award_id, award_rows in _leaderboard.groupby("award_id", sort=False, observed=True)
+    }
+
+
+@st.cache_resource
+def load_events_dataset():
+    return load_artifact_dataset("events_light")
+
+
+@st.cache_data
+def load_team_events(team, event_type=None):
+    """Read one team's events (optionally one type) from the partitioned dataset"""
+    event_filter = pc.field("team_name_ko") == team
+    if event_type:
+        event_filter = event_filter & (pc.field("type_name") == event_type)
+    
+    table = load_events_dataset().to_table(
+        filter=event_filter,
+        columns=["player_id", "player_name_ko", "start_x", "start_y", "is_success"]
+    )
+    return table.to_pandas().astype({"start_x": "float32", "start_y": "float32"})
+
+
+@st.cache_data
+def count_team_events(team):
+    return load_events_dataset().count_rows(filter=pc.field("team_name_ko") == team)
+
+
+@st.cache_data(max_entries=64)
+def build_team_figure(team, event_type, viz_mode, show_zones):
+    """Team pitch map for one (team, event type, mode, zones) selection"""
+    team_events = load_team_events(team, event_type)
+    fig = draw_pitch_plotly(show_zones=show_zones, width=800, height=1100)
+    
+    # Plot based on mode (events are already filtered by type)
+    if viz_mode == "히트맵 (밀도)":
+        fig = plot_events_heatmap(team_events, fig=fig, show_zones=show_zones)
+    else:
+        fig = plot_events_scatter(team_events, fig=fig, opacity=0.5, show_zones=show_zones)
+    
+    fig.update_layout(title=f"{team} - {event_type or '모든 이벤트'}")
+    return fig
+
+
+@st.cache_data(max_entries=64)
+def build_player_figure(player, event_type, show_zones, _player_events, _player_zone_data):
+    """Player pitch map; the player's slices are derived from the key and not hashed"""
+    fig = draw_pitch_plotly(show_zones=show_zones, width=800, height=1100)
+    fig = plot_events_scatter(
+        _player_events,
+        event_type=event_type,
+        fig=fig,
+        opacity=0.6,
+        show_zones=show_zones
+    )
+    
+    if len(_player_zone_data) > 0 and show_zones:
+        fig = plot_zone_activity(
+            _player_zone_data,
+            fig=fig,
+            metric_col="event_count",
+            show_zones=show_zones
+        )
+    
+    player_team = _player_events["team_name_ko"].iloc[0] if len(_player_events) > 0 else ""
+    fig.update_layout(title=f"{player} ({player_team}) - {event_type or '모든 이벤트'}")
+    return fig
+
+
 events_light, player_zone, leaderboard = load_pitch_data()
 
 # Tabs
@@ -65,7 +169,7 @@ with tab1:
     
     with col_filter:
         # Team selection
-        teams = sorted(events_light["team_name_ko"].unique().tolist())
+        teams = list_teams(events_light)
         selected_team = st.selectbox("팀 선택", teams, key="team_pitch")
         
         # Event type selection
@@ -84,49 +188,21 @@ with tab1:
         show_zones = st.checkbox("존 경계선 표시", value=True, key="show_zones_team")
     
     with col_plot:
-        # Filter team events
-        team_events = events_light[events_light["team_name_ko"] == selected_team].copy()
+        # Read only the selected team/type partitions
+        event_type_filter = None if selected_event == "All" else selected_event
+        total_events = count_team_events(selected_team)
+        filtered_events = load_team_events(selected_team, event_type_filter)
         
-        if len(team_events) == 0:
+        if total_events == 0:
             st.warning("선택한 팀의 데이터가 없습니다.")
         else:
-            # Create pitch
-            fig = draw_pitch_plotly(show_zones=show_zones, width=800, height=1100)
-            
-            # Plot based on mode
-            event_type_filter = None if selected_event == "All" else selected_event
-            
-            if viz_mode == "히트맵 (밀도)":
-                fig = plot_events_heatmap(
-                    team_events,
-                    event_type=event_type_filter,
-                    fig=fig,
-                    show_zones=show_zones
-                )
-            else:
-                fig = plot_events_scatter(
-                    team_events,
-                    event_type=event_type_filter,
-                    fig=fig,
-                    opacity=0.5,
-                    show_zones=show_zones
-                )
-            
-            fig.update_layout(
-                title=f"{selected_team} - {selected_event if selected_event != 'All' else '모든 이벤트'}"
-            )
-            
+            fig = build_team_figure(selected_team, event_type_filter, viz_mode, show_zones)
             st.plotly_chart(fig, use_container_width=True)
             
             # Stats
             st.markdown('<div class="section-title" style="margin-top: 20px;">📊 통계</div>', unsafe_allow_html=True)
             
             stats_cols = st.columns(4)
-            total_events = len(team_events)
-            if event_type_filter:
-                filtered_events = team_events[team_events["type_name"] == event_type_filter]
-            else:
-                filtered_events = team_events
             
             with stats_cols[0]:
                 st.metric("총 이벤트", f"{total_events:,}")
@@ -135,7 +211,7 @@ with tab1:
             with stats_cols[2]:
                 st.metric("이벤트 타입", selected_event)
             with stats_cols[3]:
-                success_rate = (filtered_events["is_success"].sum() / len(filtered_events) * 100) if len(filtered_events) > 0 else 0
+                success_rate = 100.0 * filtered_events["is_success"].to_numpy().mean() if len(filtered_events) > 0 else 0.0
                 st.metric("성공률", f"{success_rate:.1f}%")
 
 # ============================================
@@ -148,7 +224,7 @@ with tab2:
     
     with col_filter:
         # Player selection
-        players = sorted(events_light["player_name_ko"].dropna().unique().tolist())
+        players = list_players(events_light)
         selected_player = st.selectbox("선수 선택", players, key="player_pitch")
         
         # Event type selection
@@ -160,23 +236,12 @@ with tab2:
     
     with col_plot:
         # Filter player events
-        player_events = events_light[events_light["player_name_ko"] == selected_player].copy()
+        player_events = events_light[events_light["player_name_ko"] == selected_player]
         
         if len(player_events) == 0:
             st.warning("선택한 선수의 데이터가 없습니다.")
         else:
-            # Create pitch
-            fig = draw_pitch_plotly(show_zones=show_zones, width=800, height=1100)
-            
-            # Plot events
             event_type_filter = None if selected_event == "All" else selected_event
-            fig = plot_events_scatter(
-                player_events,
-                event_type=event_type_filter,
-                fig=fig,
-                opacity=0.6,
-                show_zones=show_zones
-            )
             
             # Get player zone activity
             player_zone_data = player_zone[
@@ -184,19 +249,10 @@ with tab2:
                 (player_zone["type_name"] == (selected_event if selected_event != "All" else player_zone["type_name"].iloc[0] if len(player_zone) > 0 else "Pass"))
             ]
             
-            if len(player_zone_data) > 0 and show_zones:
-                fig = plot_zone_activity(
-                    player_zone_data,
-                    fig=fig,
-                    metric_col="event_count",
-                    show_zones=show_zones
-                )
-            
-            player_team = player_events["team_name_ko"].iloc[0] if len(player_events) > 0 else ""
-            fig.update_layout(
-                title=f"{selected_player} ({player_team}) - {selected_event if selected_event != 'All' else '모든 이벤트'}"
+            fig = build_player_figure(
+                selected_player, event_type_filter, show_zones,
+                player_events, player_zone_data
             )
-            
             st.plotly_chart(fig, use_container_width=True)
             
             # Top 3 zones
@@ -236,13 +292,13 @@ with tab3:
     
     with col_filter:
         # Award selection
-        award_titles = [f"{a['icon']} {a['title']}" for a in AWARDS]
+        award_titles = [f"{a.icon} {a.title}" for a in AWARDS]
         selected_award_idx = st.selectbox("상 선택", range(len(award_titles)), 
                                          format_func=lambda x: award_titles[x],
                                          key="award_pitch")
         
         selected_award = AWARDS[selected_award_idx]
-        selected_award_id = selected_award["id"]
+        selected_award_id = selected_award.id
         
         # Top N winners
         top_n = st.slider("표시할 수상자 수", 1, 10, 3, key="top_n_winners")
@@ -251,21 +307,18 @@ with tab3:
         show_zones = st.checkbox("존 경계선 표시", value=True, key="show_zones_ignobel")
     
     with col_plot:
-        # Get winners
-        award_winners = leaderboard[
-            (leaderboard["award_id"] == selected_award_id) & 
-            (leaderboard["rank"] <= top_n)
-        ].sort_values("rank")
+        # Get winners (rank <= top_n, ties included) from the rank-sorted award slice
+        award_ranking = winners_index(leaderboard).get(selected_award_id, leaderboard.iloc[:0])
+        award_winners = award_ranking.iloc[:award_ranking["rank"].searchsorted(top_n, side="right")]
         
         if len(award_winners) == 0:
             st.warning("선택한 상의 수상자 데이터가 없습니다.")
         else:
             # Get player IDs
             winner_ids = award_winners["player_id"].tolist()
-            winner_names = award_winners["player_name_ko"].tolist()
             
             # Filter events for winners
-            winner_events = events_light[events_light["player_id"].isin(winner_ids)].copy()
+            winner_events = events_light[events_light["player_id"].isin(winner_ids)]
             
             if len(winner_events) == 0:
                 st.info("수상자의 이벤트 데이터가 없습니다.")
@@ -273,37 +326,38 @@ with tab3:
                 # Create pitch
                 fig = draw_pitch_plotly(show_zones=show_zones, width=800, height=1100)
                 
-                # Plot events with different colors for each player
-                colors = px.colors.qualitative.Set3
-                for idx, (player_id, player_name) in enumerate(zip(winner_ids, winner_names)):
-                    player_events = winner_events[winner_events["player_id"] == player_id]
-                    if len(player_events) > 0:
-                        fig.add_trace(go.Scatter(
-                            x=player_events["start_x"],
-                            y=player_events["start_y"],
-                            mode='markers',
-                            name=player_name,
-                            marker=dict(
-                                color=colors[idx % len(colors)],
-                                size=6,
-                                opacity=0.5,
-                                line=dict(width=0.5, color="white")
-                            ),
-                            hovertemplate=f"<b>{player_name}</b><br>" +
-                                        "X: %{x:.1f}<br>" +
-                                        "Y: %{y:.1f}<extra></extra>"
-                        ))
+                # One WebGL trace for all winners, colored per player
+                # (the winner cards below carry the same color as a legend).
+                # Points carry numeric palette codes + a discrete colorscale, so
+                # plotly validates one array instead of a color string per point
+                colors = qualitative.Set3
+                player_colors = {
+                    player_id: colors[idx % len(colors)]
+                    for idx, player_id in enumerate(winner_ids)
+                }
+                player_codes = pd.Categorical(winner_events["player_id"], categories=winner_ids).codes
+                fig.add_trace(go.Scattergl(
+                    x=winner_events["start_x"],
+                    y=winner_events["start_y"],
+                    mode='markers',
+                    marker=dict(
+                        color=player_codes % len(colors),
+                        colorscale=[[idx / (len(colors) - 1), color] for idx, color in enumerate(colors)],
+                        cmin=0,
+                        cmax=len(colors) - 1,
+                        size=6,
+                        opacity=0.5,
+                        line=dict(width=0.5, color="white")
+                    ),
+                    text=winner_events["player_name_ko"],
+                    hovertemplate="<b>%{text}</b><br>" +
+                                  "X: %{x:.1f}<br>" +
+                                  "Y: %{y:.1f}<extra></extra>",
+                    showlegend=False
+                ))
                 
                 fig.update_layout(
-                    title=f"{selected_award['icon']} {selected_award['title']} 수상자 활동 지도",
-                    showlegend=True,
-                    legend=dict(
-                        orientation="h",
-                        yanchor="bottom",
-                        y=1.02,
-                        xanchor="right",
-                        x=1
-                    )
+                    title=f"{selected_award.icon} {selected_award.title} 수상자 활동 지도"
                 )
                 
                 st.plotly_chart(fig, use_container_width=True)
@@ -315,11 +369,12 @@ with tab3:
                 for idx, (_, winner) in enumerate(award_winners.iterrows()):
                     with winner_cols[idx]:
                         rank_emoji = "🥇" if winner["rank"] == 1 else "🥈" if winner["rank"] == 2 else "🥉" if winner["rank"] == 3 else f"#{int(winner['rank'])}"
+                        winner_color = player_colors[winner["player_id"]]
                         winner_html = f"""
-                        <div class="award-card" style="padding: 16px; text-align: center;">
+                        <div class="award-card" style="padding: 16px; text-align: center; border-top: 4px solid {winner_color};">
                             <div style="font-size: 1.5rem; margin-bottom: 8px;">{rank_emoji}</div>
-                            <div class="award-player" style="font-size: 1rem;">{winner['player_name_ko']}</div>
-                            <div class="award-team" style="font-size: 0.85rem;">{winner['team_name_ko']}</div>
+                            <div class="award-player" style="font-size: 1rem;">{escape_html(winner['player_name_ko'])}</div>
+                            <div class="award-team" style="font-size: 0.85rem;">{escape_html(winner['team_name_ko'])}</div>
                             <div class="award-subtext" style="margin-top: 8px;">점수: {winner['score']:.3f}</div>
                         </div>
                         """
@@ -10,10 +10,9 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.io import load_artifact
-from src.ui_components import inject_custom_css, render_sidebar_toggle
+from src.io import load_artifact, load_artifact_arrow
+from src.ui_components import escape_html, inject_custom_css, render_sidebar_toggle
 import plotly.graph_objects as go
-import plotly.express as px
 
 st.set_page_config(
     page_title="Team Patterns | K League 이그노벨상",
@@ -41,11 +40,23 @@ st.markdown("""
 # Load data
 @st.cache_data
 def load_pattern_data():
-    team_zone = load_artifact("team_zone_profile.parquet")
-    league_avg = load_artifact("league_zone_average.parquet")
-    return team_zone, league_avg
+    # Team list from the partition key only (sorted categories); team rows are read per selection
+    team_names = load_artifact_arrow("team_zone", columns=["team_name_ko"]).column("team_name_ko")
+    teams = team_names.to_pandas().astype("category").cat.categories.tolist()
+    league_avg = load_artifact(
+        "league_zone_average.parquet",
+        columns=["zone", "type_name", "league_count", "league_success_rate"]
+    )
+    return teams, league_avg
+
+@st.cache_data
+def load_team_zone(selected_team):
+    """One team's zone profile, read from its partition only"""
+    return load_artifact_arrow(
+        "team_zone", filters=[("team_name_ko", "=", selected_team)]
+    ).to_pandas()
 
-team_zone, league_avg = load_pattern_data()
+teams, league_avg = load_pattern_data()
 
 # Zone order for consistent display
 ZONE_ORDER = [
@@ -57,6 +68,80 @@ ZONE_ORDER = [
 
 EVENT_TYPES = ["Pass", "Shot", "Cross", "Duel", "Tackle", "Interception", "Foul"]
 
+def aggregate_zones(team_data, league_avg):
+    """
+    Sum counts per zone and count-weight the success rate (0 where no events)
+    for team and league together, in one groupby over the stacked frames
+    """
+    combined = pd.concat([
+        pd.DataFrame({
+            "_src": "team",
+            "zone": team_data["zone"].astype(str),
+            "count": team_data["event_count"],
+            "rate": team_data["success_rate"]
+        }),
+        pd.DataFrame({
+            "_src": "league",
+            "zone": league_avg["zone"].astype(str),
+            "count": league_avg["league_count"],
+            "rate": league_avg["league_success_rate"]
+        })
+    ], ignore_index=True)
+    combined["_wsum"] = combined["rate"] * combined["count"]
+    
+    grouped = combined.groupby(["_src", "zone"]).agg(
+        count=("count", "sum"), _wsum=("_wsum", "sum")
+    ).reset_index()
+    grouped["rate"] = np.where(grouped["count"] > 0, grouped["_wsum"].div(grouped["count"]), 0.0)
+    
+    is_team = grouped["_src"] == "team"
+    team_zones = grouped.loc[is_team, ["zone", "count", "rate"]].rename(
+        columns={"count": "event_count", "rate": "success_rate"}
+    ).reset_index(drop=True)
+    league_zones = grouped.loc[~is_team, ["zone", "count", "rate"]].rename(
+        columns={"count": "league_count", "rate": "league_success_rate"}
+    ).reset_index(drop=True)
+    return team_zones, league_zones
+
+@st.cache_data
+def build_zone_frames(_league_avg, selected_team, selected_event):
+    """Team and league zone frames for one (team, event) selection"""
+    team_data = load_team_zone(selected_team)
+    
+    if selected_event != "All":
+        team_data = team_data[team_data["event_type"] == selected_event]
+        league_data = _league_avg[_league_avg["type_name"] == selected_event]
+    else:
+        # Aggregate all event types - totals and count-weighted success rates
+        team_data, league_data = aggregate_zones(team_data, _league_avg)
+        team_data["event_type"] = "All"
+        league_data["type_name"] = "All"
+    
+    return team_data, league_data
+
+@st.cache_data
+def build_zone_df(_league_avg, selected_team, selected_event, metric_col, league_metric_col):
+    """Per-zone team vs league values in ZONE_ORDER for one metric"""
+    team_data, league_data = build_zone_frames(_league_avg, selected_team, selected_event)
+    
+    # Align both sides on ZONE_ORDER in one reindex (missing zones -> 0)
+    team_values = team_data.set_index("zone")[metric_col].reindex(ZONE_ORDER, fill_value=0).to_numpy()
+    league_values = league_data.set_index("zone")[league_metric_col].reindex(ZONE_ORDER, fill_value=0).to_numpy()
+    
+    # Branchless diff: zones without a league value get 0 for both diff and diff_pct
+    has_league = league_values > 0
+    diff = np.where(has_league, team_values - league_values, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        diff_pct = np.where(has_league, diff / league_values * 100, 0)
+    
+    return pd.DataFrame({
+        "zone": ZONE_ORDER,
+        "team_value": team_values,
+        "league_value": league_values,
+        "diff": diff,
+        "diff_pct": diff_pct
+    })
+
 # Filters
 col_filter, col_main = st.columns([1, 4])
 
@@ -64,7 +149,6 @@ with col_filter:
     st.markdown("### 필터")
     
     # Team selection
-    teams = sorted(team_zone["team_name_ko"].unique().tolist())
     selected_team = st.selectbox("팀 선택", teams, key="pattern_team")
     
     # Event type
@@ -78,53 +162,6 @@ with col_filter:
     )
 
 with col_main:
-    # Filter data
-    team_data = team_zone[team_zone["team_name_ko"] == selected_team].copy()
-    
-    if selected_event != "All":
-        team_data = team_data[team_data["event_type"] == selected_event].copy()
-        league_data = league_avg[league_avg["type_name"] == selected_event].copy()
-    else:
-        # Aggregate all event types - calculate totals and weighted averages
-        # For team data
-        team_data_total = team_data.groupby("zone")["event_count"].sum().reset_index()
-        
-        # Calculate weighted average success_rate per zone
-        team_success = []
-        for zone in team_data["zone"].unique():
-            zone_data = team_data[team_data["zone"] == zone]
-            weights = zone_data["event_count"].values
-            values = zone_data["success_rate"].values
-            if len(weights) > 0 and weights.sum() > 0:
-                weighted_avg = np.average(values, weights=weights)
-            else:
-                weighted_avg = 0.0
-            team_success.append({"zone": zone, "success_rate": weighted_avg})
-        
-        team_success_df = pd.DataFrame(team_success)
-        team_data = team_data_total.merge(team_success_df, on="zone", how="left")
-        team_data["success_rate"] = team_data["success_rate"].fillna(0)
-        team_data["event_type"] = "All"
-        
-        # For league data
-        league_data_total = league_avg.groupby("zone")["league_count"].sum().reset_index()
-        
-        league_success_list = []
-        for zone in league_avg["zone"].unique():
-            zone_data = league_avg[league_avg["zone"] == zone]
-            weights = zone_data["league_count"].values
-            values = zone_data["league_success_rate"].values
-            if len(weights) > 0 and weights.sum() > 0:
-                weighted_avg = np.average(values, weights=weights)
-            else:
-                weighted_avg = 0.0
-            league_success_list.append({"zone": zone, "league_success_rate": weighted_avg})
-        
-        league_success_df = pd.DataFrame(league_success_list)
-        league_data = league_data_total.merge(league_success_df, on="zone", how="left")
-        league_data["league_success_rate"] = league_data["league_success_rate"].fillna(0)
-        league_data["type_name"] = "All"
-    
     # Prepare data for heatmap
     if metric_type == "이벤트 수 (빈도)":
         metric_col = "event_count"
@@ -135,27 +172,7 @@ with col_main:
         league_metric_col = "league_success_rate"
         title_suffix = "성공률"
     
-    # Create zone matrix
-    zone_matrix = []
-    for zone in ZONE_ORDER:
-        team_val = team_data[team_data["zone"] == zone][metric_col].values
-        league_val = league_data[league_data["zone"] == zone][league_metric_col].values
-        
-        team_val = team_val[0] if len(team_val) > 0 else 0
-        league_val = league_val[0] if len(league_val) > 0 else 0
-        
-        diff = team_val - league_val if league_val > 0 else 0
-        diff_pct = (diff / league_val * 100) if league_val > 0 else 0
-        
-        zone_matrix.append({
-            "zone": zone,
-            "team_value": team_val,
-            "league_value": league_val,
-            "diff": diff,
-            "diff_pct": diff_pct
-        })
-    
-    zone_df = pd.DataFrame(zone_matrix)
+    zone_df = build_zone_df(league_avg, selected_team, selected_event, metric_col, league_metric_col)
     
     # 1. Zone Profile Heatmap
     st.markdown('<div class="section-title">📊 Zone 프로필 히트맵</div>', unsafe_allow_html=True)
@@ -227,32 +244,31 @@ with col_main:
     st.markdown('<div class="section-title" style="margin-top: 40px;">📊 차이 분석</div>', unsafe_allow_html=True)
     
     # Sort by absolute difference
-    zone_df_sorted = zone_df.copy()
-    zone_df_sorted["abs_diff"] = zone_df_sorted["diff"].abs()
-    zone_df_sorted = zone_df_sorted.sort_values("abs_diff", ascending=False)
+    zone_df_sorted = zone_df.assign(abs_diff=zone_df["diff"].abs()).sort_values(
+        "abs_diff", ascending=False, kind="stable"
+    )
     
     # Top differences
     st.markdown("#### 차이가 큰 Zone TOP 5")
     
     diff_cols = st.columns(5)
-    for idx, (_, row) in enumerate(zone_df_sorted.head(5).iterrows()):
-        with diff_cols[idx]:
-            diff_class = "better" if row["diff"] > 0 else "worse"
-            diff_sign = "+" if row["diff"] > 0 else ""
-            
-            diff_html = f"""
-            <div class="award-card" style="padding: 16px; text-align: center;">
-                <div class="award-title" style="font-size: 1rem;">{row['zone']}</div>
-                <div class="{diff_class}" style="font-size: 1.2rem; margin: 8px 0;">
-                    {diff_sign}{row['diff']:.2f}
-                </div>
-                <div class="award-subtext" style="font-size: 0.85rem;">
-                    팀: {row['team_value']:.2f}<br>
-                    리그: {row['league_value']:.2f}
-                </div>
+    top5 = zone_df_sorted.head(5)[["zone", "diff", "team_value", "league_value"]].to_numpy()
+    for idx, (zone, diff, team_value, league_value) in enumerate(top5):
+        diff_class = "better" if diff > 0 else "worse"
+        diff_sign = "+" if diff > 0 else ""
+        
+        diff_cols[idx].markdown(f"""
+        <div class="award-card" style="padding: 16px; text-align: center;">
+            <div class="award-title" style="font-size: 1rem;">{zone}</div>
+            <div class="{diff_class}" style="font-size: 1.2rem; margin: 8px 0;">
+                {diff_sign}{diff:.2f}
             </div>
-            """
-            st.markdown(diff_html, unsafe_allow_html=True)
+            <div class="award-subtext" style="font-size: 0.85rem;">
+                팀: {team_value:.2f}<br>
+                리그: {league_value:.2f}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
     
     # 4. Auto-generated Summary
     st.markdown('<div class="section-title" style="margin-top: 40px;">📝 패턴 요약</div>', unsafe_allow_html=True)
@@ -264,12 +280,12 @@ with col_main:
     
     if diff_val > 0:
         summary_text = (
-            f"**{selected_team}**은(는) **{zone_name}**에서 리그 평균보다 {diff_val:.2f} 높은 {title_suffix}를 보입니다. "
+            f"**{escape_html(selected_team)}**은(는) **{zone_name}**에서 리그 평균보다 {diff_val:.2f} 높은 {title_suffix}를 보입니다. "
             f"이 Zone에서의 활동이 다른 팀들보다 활발한 편입니다."
         )
     else:
         summary_text = (
-            f"**{selected_team}**은(는) **{zone_name}**에서 리그 평균보다 {abs(diff_val):.2f} 낮은 {title_suffix}를 보입니다. "
+            f"**{escape_html(selected_team)}**은(는) **{zone_name}**에서 리그 평균보다 {abs(diff_val):.2f} 낮은 {title_suffix}를 보입니다. "
             f"이 Zone에서의 활동이 다른 팀들보다 상대적으로 적습니다."
         )
     
@@ -297,10 +313,16 @@ with col_main:
     # Data table
     st.markdown('<div class="section-title" style="margin-top: 40px;">📋 상세 데이터</div>', unsafe_allow_html=True)
     
-    display_df = zone_df[["zone", "team_value", "league_value", "diff", "diff_pct"]].copy()
-    display_df.columns = ["Zone", f"{selected_team}", "리그 평균", "차이", "차이(%)"]
-    display_df["차이(%)"] = display_df["차이(%)"].round(1)
-    display_df = display_df.sort_values("차이", key=lambda x: x.abs(), ascending=False)
+    display_df = zone_df[["zone", "team_value", "league_value", "diff", "diff_pct"]].rename(columns={
+        "zone": "Zone",
+        "team_value": f"{selected_team}",
+        "league_value": "리그 평균",
+        "diff": "차이",
+        "diff_pct": "차이(%)"
+    }).assign(**{"차이(%)": zone_df["diff_pct"].round(1)})
+    display_df = display_df.assign(_abs=np.abs(zone_df["diff"].to_numpy())).sort_values(
+        "_abs", ascending=False
+    ).drop(columns="_abs")
     
     st.dataframe(display_df, use_container_width=True, hide_index=True)
 
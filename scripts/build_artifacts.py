@@ -2,8 +2,11 @@
 Batch script to build artifacts from raw data
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pandas as pd
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -16,6 +19,30 @@ from src.aggregate import (
 )
 from src.awards_engine import calculate_metrics, compute_award_scores
 
+# Low-cardinality name columns stored as dictionary-encoded parquet
+CATEGORY_COLS = ["team_name_ko", "zone", "event_type"]
+
+# Float columns kept at float64: award scores are shown to three decimals and
+# averaged (team means vs league_avg_score). *_id columns are also kept, since
+# float32 is lossy for identifiers above 2**24
+FLOAT64_COLS = ["score", "league_avg_score"]
+
+
+def downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink float64/int64 columns and categorize name columns before saving"""
+    df = df.copy()
+    for col in df.select_dtypes("float64").columns:
+        if col in FLOAT64_COLS or col.endswith("_id"):
+            continue
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    for col in df.select_dtypes("int64").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
 print("=" * 70)
 print("Building K League Ignobel Awards Artifacts")
 print("=" * 70)
@@ -36,20 +63,25 @@ print("\n[3/5] Aggregating player statistics...")
 player_stats = aggregate_player_stats(preprocessed)
 print(f"  Aggregated stats for {len(player_stats):,} players")
 
-# 4. Calculate special metrics
+# 4-5. Special metrics and attack stats are independent reads of the same
+# preprocessed frame, so run them concurrently. Threads share the frame without
+# pickling it and overlap wherever pandas/NumPy release the GIL.
 print("\n[4/6] Calculating special metrics...")
-clearance_panic = calculate_clearance_panic(preprocessed)
-print(f"  Clearance panic: {len(clearance_panic):,} players")
+print("[5/6] Aggregating attack statistics...")
+with ThreadPoolExecutor(max_workers=4) as pool:
+    clearance_panic_job = pool.submit(calculate_clearance_panic, preprocessed)
+    second_half_drop_job = pool.submit(calculate_second_half_drop, preprocessed)
+    def_third_turnover_job = pool.submit(calculate_def_third_turnover, preprocessed)
+    attack_stats_job = pool.submit(aggregate_attack_stats, preprocessed, match_info)
+    
+    clearance_panic = clearance_panic_job.result()
+    second_half_drop = second_half_drop_job.result()
+    def_third_turnover = def_third_turnover_job.result()
+    attack_stats = attack_stats_job.result()
 
-second_half_drop = calculate_second_half_drop(preprocessed)
+print(f"  Clearance panic: {len(clearance_panic):,} players")
 print(f"  Second half drop: {len(second_half_drop):,} players")
-
-def_third_turnover = calculate_def_third_turnover(preprocessed)
 print(f"  Defensive third turnover: {len(def_third_turnover):,} players")
-
-# 5. Aggregate attack stats
-print("\n[5/6] Aggregating attack statistics...")
-attack_stats = aggregate_attack_stats(preprocessed, match_info)
 print(f"  Attack stats: {len(attack_stats):,} players")
 
 # 6. Calculate metrics and award scores
@@ -63,6 +95,8 @@ player_stats_with_metrics = calculate_metrics(
 )
 
 award_scores = compute_award_scores(player_stats_with_metrics)
+award_scores["award_id"] = award_scores["award_id"].astype("category")
+award_scores["rank"] = award_scores["rank"].astype("int16")
 print(f"  Calculated scores for {len(award_scores):,} award-player combinations")
 
 # 6. Create leaderboard
@@ -73,20 +107,32 @@ profiles = player_stats_with_metrics.copy()
 
 # 8. Save artifacts
 print("\n[7/7] Saving artifacts...")
-save_artifact(player_stats_with_metrics, "awards_player.parquet")
+save_artifact(downcast(player_stats_with_metrics), "awards_player.parquet")
 print("  Saved: awards_player.parquet")
 
-save_artifact(award_scores, "leaderboard.parquet")
+save_artifact(downcast(award_scores), "leaderboard.parquet")
 print("  Saved: leaderboard.parquet")
 
-save_artifact(profiles, "profiles.parquet")
+# League-wide per-award means (Teams page comparison)
+league_award_means = award_scores.groupby("award_id", sort=False, observed=True).agg(
+    league_avg_score=("score", "mean"),
+    league_count=("score", "count")
+).reset_index()
+save_artifact(downcast(league_award_means), "league_award_means.parquet")
+print("  Saved: league_award_means.parquet")
+
+save_artifact(downcast(profiles), "profiles.parquet")
 print("  Saved: profiles.parquet")
 
 # Team awards (placeholder - can be expanded)
-team_stats = player_stats.groupby("team_name_ko").agg({
-    col: "sum" for col in player_stats.select_dtypes(include=['number']).columns
-}).reset_index()
-save_artifact(team_stats, "awards_team.parquet")
+team_stats = (
+    player_stats.select_dtypes(include=["number"])
+    .assign(team_name_ko=player_stats["team_name_ko"])
+    .groupby("team_name_ko", sort=False, observed=True)
+    .sum()
+    .reset_index()
+)
+save_artifact(downcast(team_stats), "awards_team.parquet")
 print("  Saved: awards_team.parquet")
 
 print("\n" + "=" * 70)
@@ -43,6 +43,7 @@ preprocess_module = import_from_path("kleague_preprocess", PROJECT_ROOT / "src"
 load_raw_data = io_module.load_raw_data
 load_match_info = io_module.load_match_info
 save_artifact = io_module.save_artifact
+save_artifact_dataset = io_module.save_artifact_dataset
 preprocess_events = preprocess_module.preprocess_events
 
 # Import zone utilities from open_track2 (with fallback)
@@ -190,9 +191,26 @@ events_light = events_with_zones[[
     "zone", "zone_x", "zone_y", "is_success", "is_fail"
 ]].copy()
 
+# Low-cardinality names as category (stored as dictionary-encoded parquet)
+for col in ["team_name_ko", "player_name_ko", "type_name"]:
+    events_light[col] = events_light[col].astype("category")
+
+# Pitch coordinates need no more than float32 precision
+for col in ["start_x", "start_y", "end_x", "end_y"]:
+    events_light[col] = events_light[col].astype("float32")
+
 save_artifact(events_light, "events_light.parquet")
 print(f"  Saved: events_light.parquet ({len(events_light):,} events)")
 
+# Pitch map slices: partitioned by team/type so the page reads only the selection
+save_artifact_dataset(
+    events_light[["team_name_ko", "type_name", "player_id", "player_name_ko",
+                  "start_x", "start_y", "is_success"]].astype({"player_name_ko": "string"}),
+    "events_light",
+    partition_cols=["team_name_ko", "type_name"]
+)
+print("  Saved: events_light/ (partitioned by team_name_ko, type_name)")
+
 # 4. Create team_zone_profile (vectorized - single groupby)
 print("\n[4/4] Creating team_zone_profile.parquet...")
 
@@ -225,10 +243,18 @@ team_zone_df = team_zone_profile.merge(
     how="left"
 )
 team_zone_df["success_rate"] = team_zone_df["success_rate"].fillna(0)
+team_zone_df["zone"] = team_zone_df["zone"].astype("category")
+team_zone_df["team_name_ko"] = team_zone_df["team_name_ko"].astype("category")
+# Keep rows sorted by (team, zone) so per-team slices are contiguous zone runs
+team_zone_df = team_zone_df.sort_values(["team_name_ko", "zone"], kind="stable", ignore_index=True)
 
 save_artifact(team_zone_df, "team_zone_profile.parquet")
 print(f"  Saved: team_zone_profile.parquet ({len(team_zone_df):,} rows)")
 
+# Team Patterns reads one team at a time: partition by team for pushdown
+save_artifact_dataset(team_zone_df, "team_zone", partition_cols=["team_name_ko"])
+print("  Saved: team_zone/ (partitioned by team_name_ko)")
+
 # 5. Create player_zone_activity (vectorized)
 print("\n[5/4] Creating player_zone_activity.parquet...")
 
@@ -281,6 +307,8 @@ print("[SUCCESS] Pattern artifacts built successfully!")
 print("=" * 70)
 print("\nArtifacts created:")
 print("  - events_light.parquet")
+print("  - events_light/")
 print("  - team_zone_profile.parquet")
+print("  - team_zone/")
 print("  - player_zone_activity.parquet")
 print("  - league_zone_average.parquet")
@@ -0,0 +1,37 @@
+"""
+Minify static/theme.css into static/theme.min.css
+
+The app inlines the minified file (shorter <style> payload per rerun); edit
+theme.css and re-run:
+
+    python scripts/minify_css.py
+"""
+import re
+from pathlib import Path
+
+try:
+    from rcssmin import cssmin
+except ImportError:  # rcssmin is optional; the regex pass covers this stylesheet
+    cssmin = None
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+SOURCE = STATIC_DIR / "theme.css"
+TARGET = STATIC_DIR / "theme.min.css"
+
+
+def minify(css: str) -> str:
+    """Strip comments and collapse whitespace around CSS punctuation"""
+    if cssmin is not None:
+        return cssmin(css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+if __name__ == "__main__":
+    raw = SOURCE.read_text(encoding="utf-8")
+    minified = minify(raw)
+    TARGET.write_text(minified + "\n", encoding="utf-8")
+    print(f"{SOURCE.name}: {len(raw):,} bytes -> {TARGET.name}: {len(minified):,} bytes")
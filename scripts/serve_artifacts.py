@@ -0,0 +1,64 @@
+"""
+Arrow Flight server for parquet artifacts
+
+Loads every artifacts/*.parquet file and hive-partitioned dataset directory
+(e.g. events_light/, team_zone/) once into Arrow tables and serves them over
+Flight, so Streamlit replicas fetch in-memory tables instead of re-parsing
+parquet. Point the app at it with:
+
+    KLEAGUE_ARTIFACT_FLIGHT=grpc://localhost:8815 streamlit run app.py
+"""
+import sys
+from pathlib import Path
+
+import pyarrow.dataset as ds
+import pyarrow.flight as flight
+import pyarrow.parquet as pq
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.io import ARTIFACTS_DIR
+
+DEFAULT_LOCATION = "grpc://0.0.0.0:8815"
+
+
+class ArtifactFlightServer(flight.FlightServerBase):
+    """Serve artifact tables by file or directory name ticket (e.g. b"leaderboard.parquet", b"team_zone")"""
+
+    def __init__(self, location: str = DEFAULT_LOCATION):
+        super().__init__(location)
+        self.tables = {
+            path.name: pq.read_table(path)
+            for path in sorted(ARTIFACTS_DIR.glob("*.parquet"))
+        }
+        self.tables.update({
+            path.name: ds.dataset(path, format="parquet", partitioning="hive").to_table()
+            for path in sorted(ARTIFACTS_DIR.iterdir())
+            if path.is_dir()
+        })
+
+    def list_flights(self, context, criteria):
+        for name, table in self.tables.items():
+            descriptor = flight.FlightDescriptor.for_path(name)
+            endpoint = flight.FlightEndpoint(name.encode(), [])
+            yield flight.FlightInfo(table.schema, descriptor, [endpoint], table.num_rows, table.nbytes)
+
+    def do_get(self, context, ticket):
+        name = ticket.ticket.decode()
+        if name not in self.tables:
+            raise flight.FlightServerError(f"Artifact not found: {name}")
+        return flight.RecordBatchStream(self.tables[name])
+
+
+if __name__ == "__main__":
+    location = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOCATION
+    server = ArtifactFlightServer(location)
+
+    print("=" * 70)
+    print(f"Serving {len(server.tables)} artifacts on {location}")
+    print("=" * 70)
+    for name, table in server.tables.items():
+        print(f"  {name}: {table.num_rows:,} rows")
+
+    server.serve()
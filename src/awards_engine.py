@@ -131,9 +131,9 @@ def compute_award_scores(stats: pd.DataFrame, award_configs: list = None) -> pd.
     results = []
     
     for award in award_configs:
-        award_id = award["id"]
-        metric = award["metric"]
-        min_attempts = award.get("min_attempts", 0)
+        award_id = award.id
+        metric = award.metric
+        min_attempts = award.min_attempts
         
         if metric not in stats.columns:
             continue
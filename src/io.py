@@ -1,9 +1,14 @@
 """
 Data I/O utilities
 """
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
 # Project root (assuming this file is in kleague_ignobel/src/)
 _PROJECT_ROOT = Path(__file__).parent.parent
@@ -16,6 +21,12 @@ MATCH_INFO_PATH = _OPEN_TRACK2_ROOT / "match_info.csv"
 # Artifacts directory
 ARTIFACTS_DIR = _PROJECT_ROOT / "artifacts"
 
+# Optional Arrow Flight artifact server (scripts/serve_artifacts.py),
+# e.g. "grpc://localhost:8815". When unset, artifacts are read from disk.
+# Partitioned dataset directories are served as whole tables and filtered
+# client-side, so every loader below works without a local artifacts/.
+ARTIFACT_FLIGHT_URI = os.environ.get("KLEAGUE_ARTIFACT_FLIGHT")
+
 
 def load_raw_data(path: Optional[Path] = None) -> pd.DataFrame:
     """Load raw event data"""
@@ -47,12 +58,107 @@ def save_artifact(df: pd.DataFrame, filename: str) -> Path:
     return filepath
 
 
-def load_artifact(filename: str) -> pd.DataFrame:
-    """Load artifact from parquet file"""
+def load_artifact(filename: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load artifact from parquet file
+    
+    columns: optional column projection - only these columns are read from disk
+    """
+    if ARTIFACT_FLIGHT_URI:
+        return _load_artifact_flight(filename, columns)
+    
     filepath = ARTIFACTS_DIR / filename
     if not filepath.exists():
         raise FileNotFoundError(f"Artifact not found at {filepath}")
     
-    return pd.read_parquet(filepath)
+    return pd.read_parquet(filepath, columns=columns)
+
+
+@lru_cache(maxsize=1)
+def _flight_client():
+    import pyarrow.flight as flight
+    return flight.connect(ARTIFACT_FLIGHT_URI)
+
+
+@lru_cache(maxsize=32)
+def _flight_table(name: str) -> pa.Table:
+    """
+    Fetch an artifact (file or dataset directory name) from the Flight server
+    
+    Fetched once per process. Buffers are copied to type-aligned memory on
+    read: Flight message buffers (notably dictionaries) can be misaligned,
+    which makes every Acero filter/scan over them log a warning.
+    """
+    import pyarrow.flight as flight
+    options = flight.FlightCallOptions(
+        read_options=pa.ipc.IpcReadOptions(ensure_alignment=pa.ipc.Alignment.DataTypeSpecific)
+    )
+    try:
+        reader = _flight_client().do_get(flight.Ticket(name.encode()), options)
+    except flight.FlightServerError as e:
+        raise FileNotFoundError(f"Artifact not found on {ARTIFACT_FLIGHT_URI}: {name}") from e
+    
+    return reader.read_all()
 
 
+def _load_artifact_flight(filename: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Fetch artifact table from the Flight artifact server"""
+    table = _flight_table(filename)
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas()
+
+
+def save_artifact_dataset(df: pd.DataFrame, dirname: str, partition_cols: List[str]) -> Path:
+    """Save artifact as a hive-partitioned parquet dataset directory"""
+    ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+    dirpath = ARTIFACTS_DIR / dirname
+    df.to_parquet(
+        dirpath,
+        partition_cols=partition_cols,
+        index=False,
+        existing_data_behavior="delete_matching"
+    )
+    return dirpath
+
+
+def load_artifact_dataset(dirname: str) -> ds.Dataset:
+    """
+    Open a hive-partitioned parquet artifact without reading it
+    
+    Filters passed to Dataset.to_table() skip non-matching partitions on disk.
+    Over Flight the whole table is fetched once (cached) and wrapped as an
+    in-memory dataset, so the same to_table()/count_rows() calls work.
+    """
+    if ARTIFACT_FLIGHT_URI:
+        return ds.dataset(_flight_table(dirname))
+    
+    dirpath = ARTIFACTS_DIR / dirname
+    if not dirpath.exists():
+        raise FileNotFoundError(f"Artifact dataset not found at {dirpath}")
+    
+    return ds.dataset(dirpath, format="parquet", partitioning="hive")
+
+
+def load_artifact_arrow(name: str, filters: Optional[List[tuple]] = None,
+                        columns: Optional[List[str]] = None) -> pa.Table:
+    """
+    Load a parquet artifact (file or hive-partitioned directory) as an Arrow table
+    
+    filters: pyarrow-style predicates, e.g. [("team_name_ko", "=", "FC서울")];
+    pushed down so non-matching partitions/row groups are never read
+    (over Flight they filter the cached fetched table instead)
+    """
+    expression = pq.filters_to_expression(filters) if filters else None
+    if ARTIFACT_FLIGHT_URI:
+        table = _flight_table(name)
+        if expression is not None:
+            table = table.filter(expression)
+        return table.select(columns) if columns is not None else table
+    
+    path = ARTIFACTS_DIR / name
+    if not path.exists():
+        raise FileNotFoundError(f"Artifact not found at {path}")
+    
+    dataset = ds.dataset(path, format="parquet", partitioning="hive" if path.is_dir() else None)
+    return dataset.to_table(filter=expression, columns=columns)
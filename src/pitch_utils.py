@@ -2,108 +2,154 @@
 Pitch plotting utilities for Plotly
 Lightweight version for Streamlit
 """
+from functools import lru_cache
+
 import plotly.graph_objects as go
-import plotly.express as px
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:
+    # Numba is optional; np.histogram2d is used without it
+    njit = None
 
-def draw_pitch_plotly(fig=None, pitch_color="#0a2e36", line_color="#ffffff", 
-                     width=700, height=1000, show_zones=False):
-    """
-    Draw a soccer pitch on Plotly figure
-    
-    Pitch dimensions: 105m x 68m (x: 0-105, y: 0-68)
-    """
-    if fig is None:
-        fig = go.Figure()
-    
-    # Pitch outline
-    pitch_rect = dict(
-        type="rect",
-        x0=0, y0=0, x1=105, y1=68,
-        line=dict(color=line_color, width=2),
-        fillcolor=pitch_color,
-        layer="below"
-    )
-    fig.add_shape(pitch_rect)
-    
-    # Center line
-    fig.add_shape(
-        type="line",
-        x0=52.5, y0=0, x1=52.5, y1=68,
-        line=dict(color=line_color, width=1.5),
-        layer="below"
-    )
-    
-    # Center circle
-    theta = np.linspace(0, 2*np.pi, 100)
-    circle_x = 52.5 + 9.15 * np.cos(theta)
-    circle_y = 34 + 9.15 * np.sin(theta)
-    fig.add_trace(go.Scatter(
-        x=circle_x, y=circle_y,
-        mode='lines',
-        line=dict(color=line_color, width=1.5),
-        showlegend=False,
-        hoverinfo='skip'
-    ))
-    
-    # Penalty boxes
-    # Left penalty box
-    fig.add_shape(
-        type="rect",
-        x0=0, y0=13.84, x1=16.5, y1=54.16,
-        line=dict(color=line_color, width=1.5),
-        fillcolor="rgba(0,0,0,0)",
-        layer="below"
-    )
-    
-    # Right penalty box
-    fig.add_shape(
-        type="rect",
-        x0=88.5, y0=13.84, x1=105, y1=54.16,
-        line=dict(color=line_color, width=1.5),
-        fillcolor="rgba(0,0,0,0)",
-        layer="below"
-    )
-    
-    # Goals
-    fig.add_shape(
-        type="rect",
-        x0=-2, y0=30.34, x1=0, y1=37.66,
-        line=dict(color=line_color, width=2),
-        fillcolor="rgba(0,0,0,0)",
-        layer="below"
-    )
-    fig.add_shape(
-        type="rect",
-        x0=105, y0=30.34, x1=107, y1=37.66,
-        line=dict(color=line_color, width=2),
-        fillcolor="rgba(0,0,0,0)",
-        layer="below"
-    )
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _bin2d(x, y, bins_x, bins_y, xmax, ymax, n_chunks):
+        """Parallel fixed-extent 2D histogram over [0, xmax] x [0, ymax]"""
+        n = x.shape[0]
+        partial = np.zeros((n_chunks, bins_x, bins_y), dtype=np.int64)
+        chunk = (n + n_chunks - 1) // n_chunks
+        for c in prange(n_chunks):
+            for i in range(c * chunk, min(n, (c + 1) * chunk)):
+                xi = x[i]
+                yi = y[i]
+                # Skip NaN and out-of-range points; the upper edge falls in the last bin
+                if not (0.0 <= xi <= xmax and 0.0 <= yi <= ymax):
+                    continue
+                ix = min(int(xi * bins_x / xmax), bins_x - 1)
+                iy = min(int(yi * bins_y / ymax), bins_y - 1)
+                partial[c, ix, iy] += 1
+        return partial.sum(axis=0)
+
+
+# Zone label -> center coordinates, precomputed for every "<x>-<y>" zone
+_ZONE_CENTERS_X = {"D": 13.125, "DM": 39.375, "AM": 65.625, "A": 91.875}
+_ZONE_CENTERS_Y = {"L": 11.335, "C": 34.0, "R": 56.665}
+ZONE_COORDS = {
+    f"{zx}-{zy}": (xc, yc)
+    for zx, xc in _ZONE_CENTERS_X.items()
+    for zy, yc in _ZONE_CENTERS_Y.items()
+}
+ZONE_X = {zone: xy[0] for zone, xy in ZONE_COORDS.items()}
+ZONE_Y = {zone: xy[1] for zone, xy in ZONE_COORDS.items()}
+
+# Center circle polyline (radius 9.15m around the centre spot)
+_PITCH_THETA = np.linspace(0, 2*np.pi, 100)
+_PITCH_CIRCLE_X = 52.5 + 9.15 * np.cos(_PITCH_THETA)
+_PITCH_CIRCLE_Y = 34 + 9.15 * np.sin(_PITCH_THETA)
+
+
+@lru_cache(maxsize=16)
+def _pitch_shapes(pitch_color: str, line_color: str, show_zones: bool) -> tuple:
+    """Pitch outline, boxes, goals and optional zone lines as layout shapes"""
+    shapes = [
+        # Pitch outline
+        dict(
+            type="rect",
+            x0=0, y0=0, x1=105, y1=68,
+            line=dict(color=line_color, width=2),
+            fillcolor=pitch_color,
+            layer="below"
+        ),
+        # Center line
+        dict(
+            type="line",
+            x0=52.5, y0=0, x1=52.5, y1=68,
+            line=dict(color=line_color, width=1.5),
+            layer="below"
+        ),
+        # Left penalty box
+        dict(
+            type="rect",
+            x0=0, y0=13.84, x1=16.5, y1=54.16,
+            line=dict(color=line_color, width=1.5),
+            fillcolor="rgba(0,0,0,0)",
+            layer="below"
+        ),
+        # Right penalty box
+        dict(
+            type="rect",
+            x0=88.5, y0=13.84, x1=105, y1=54.16,
+            line=dict(color=line_color, width=1.5),
+            fillcolor="rgba(0,0,0,0)",
+            layer="below"
+        ),
+        # Goals
+        dict(
+            type="rect",
+            x0=-2, y0=30.34, x1=0, y1=37.66,
+            line=dict(color=line_color, width=2),
+            fillcolor="rgba(0,0,0,0)",
+            layer="below"
+        ),
+        dict(
+            type="rect",
+            x0=105, y0=30.34, x1=107, y1=37.66,
+            line=dict(color=line_color, width=2),
+            fillcolor="rgba(0,0,0,0)",
+            layer="below"
+        ),
+    ]
     
     # Zone boundaries (if requested)
     if show_zones:
         # X-axis zones: 0-26.25, 26.25-52.5, 52.5-78.75, 78.75-105
         for x in [26.25, 52.5, 78.75]:
-            fig.add_shape(
+            shapes.append(dict(
                 type="line",
                 x0=x, y0=0, x1=x, y1=68,
                 line=dict(color=line_color, width=0.5, dash="dash"),
                 opacity=0.3,
                 layer="below"
-            )
+            ))
         
         # Y-axis zones: 0-22.67, 22.67-45.33, 45.33-68
         for y in [22.67, 45.33]:
-            fig.add_shape(
+            shapes.append(dict(
                 type="line",
                 x0=0, y0=y, x1=105, y1=y,
                 line=dict(color=line_color, width=0.5, dash="dash"),
                 opacity=0.3,
                 layer="below"
-            )
+            ))
+    
+    return tuple(shapes)
+
+
+def draw_pitch_plotly(fig=None, pitch_color="#0a2e36", line_color="#ffffff", 
+                     width=700, height=1000, show_zones=False):
+    """
+    Draw a soccer pitch on Plotly figure
+    
+    Pitch dimensions: 105m x 68m (x: 0-105, y: 0-68)
+    """
+    if fig is None:
+        fig = go.Figure()
+    
+    # Pitch markings are constant per (colors, zones); build them once
+    fig.layout.shapes = fig.layout.shapes + _pitch_shapes(pitch_color, line_color, show_zones)
+    
+    # Center circle
+    fig.add_trace(go.Scatter(
+        x=_PITCH_CIRCLE_X, y=_PITCH_CIRCLE_Y,
+        mode='lines',
+        line=dict(color=line_color, width=1.5),
+        showlegend=False,
+        hoverinfo='skip'
+    ))
     
     # Update layout
     fig.update_layout(
@@ -142,16 +188,18 @@ def plot_events_scatter(events_df: pd.DataFrame, event_type: str = None,
     
     # Filter by event type if specified
     if event_type:
-        plot_df = events_df[events_df["type_name"] == event_type].copy()
+        plot_df = events_df[events_df["type_name"] == event_type]
     else:
-        plot_df = events_df.copy()
+        plot_df = events_df
     
     if len(plot_df) == 0:
         return fig
     
-    # Sample if too many points (for performance)
+    # Too many points: bin all of them into a density layer and keep a small
+    # sample as scatter markers for hover
     if len(plot_df) > 5000:
-        plot_df = plot_df.sample(n=5000, random_state=42)
+        fig = plot_events_heatmap(plot_df, fig=fig)
+        plot_df = plot_df.sample(n=500, random_state=42)
     
     # Color mapping
     if color_col and color_col in plot_df.columns:
@@ -196,26 +244,30 @@ def plot_events_heatmap(events_df: pd.DataFrame, event_type: str = None,
     
     # Filter by event type if specified
     if event_type:
-        plot_df = events_df[events_df["type_name"] == event_type].copy()
+        plot_df = events_df[events_df["type_name"] == event_type]
     else:
-        plot_df = events_df.copy()
+        plot_df = events_df
     
     if len(plot_df) == 0:
         return fig
     
-    # Create 2D histogram
-    hist, xedges, yedges = np.histogram2d(
-        plot_df["start_x"],
-        plot_df["start_y"],
-        bins=[bins_x, bins_y],
-        range=[[0, 105], [0, 68]]
-    )
+    # Create 2D histogram (binned server-side; only the grid is sent to the browser)
+    x = plot_df["start_x"].to_numpy(dtype=np.float64)
+    y = plot_df["start_y"].to_numpy(dtype=np.float64)
+    if njit is not None:
+        hist = _bin2d(x, y, bins_x, bins_y, 105.0, 68.0, get_num_threads())
+        xedges = np.linspace(0, 105, bins_x + 1)
+        yedges = np.linspace(0, 68, bins_y + 1)
+    else:
+        hist, xedges, yedges = np.histogram2d(
+            x, y, bins=[bins_x, bins_y], range=[[0, 105], [0, 68]]
+        )
     
-    # Create heatmap
+    # Create heatmap (integer counts keep the serialized grid compact)
     fig.add_trace(go.Heatmap(
         x=(xedges[:-1] + xedges[1:]) / 2,
         y=(yedges[:-1] + yedges[1:]) / 2,
-        z=hist.T,
+        z=hist.T.astype(np.int32),
         colorscale="YlOrRd",
         showscale=True,
         opacity=0.6,
@@ -235,32 +287,31 @@ def plot_zone_activity(zone_activity_df: pd.DataFrame, fig=None,
     if fig is None:
         fig = draw_pitch_plotly(show_zones=show_zones)
     
-    # Zone centers (approximate)
-    zone_centers = {
-        "D": 13.125, "DM": 39.375, "AM": 65.625, "A": 91.875,  # x-axis
-        "L": 11.335, "C": 34.0, "R": 56.665  # y-axis
-    }
+    if "zone" not in zone_activity_df.columns:
+        return fig
+    
+    # Create zone heatmap data: precomputed centers for the 12 zone labels
+    zones = zone_activity_df["zone"].astype(str)
+    xs = zones.map(ZONE_X)
+    ys = zones.map(ZONE_Y)
     
-    # Create zone heatmap data
-    zone_data = []
-    for _, row in zone_activity_df.iterrows():
-        zone = row.get("zone", "")
-        if "-" in zone:
-            zone_x, zone_y = zone.split("-")
-            x_center = zone_centers.get(zone_x, 52.5)
-            y_center = zone_centers.get(zone_y, 34)
-            value = row.get(metric_col, 0)
-            zone_data.append({
-                "x": x_center,
-                "y": y_center,
-                "value": value,
-                "zone": zone
-            })
+    # Partial labels (e.g. "A-nan") keep the per-part lookup with pitch-centre fallback
+    partial = xs.isna() & zones.str.contains("-", regex=False)
+    if partial.any():
+        parts = zones[partial].str.split("-", n=1, expand=True)
+        xs[partial] = parts[0].map(_ZONE_CENTERS_X).fillna(52.5)
+        ys[partial] = parts[1].map(_ZONE_CENTERS_Y).fillna(34)
     
-    if not zone_data:
+    plotted = xs.notna()
+    if not plotted.any():
         return fig
     
-    zone_df = pd.DataFrame(zone_data)
+    zone_df = pd.DataFrame({
+        "x": xs[plotted],
+        "y": ys[plotted],
+        "value": zone_activity_df.loc[plotted, metric_col] if metric_col in zone_activity_df.columns else 0,
+        "zone": zones[plotted]
+    })
     
     # Add zone activity as scatter with size
     max_value = zone_df["value"].max()
@@ -1,6 +1,7 @@
 """
 Data preprocessing utilities
 """
+import numpy as np
 import pandas as pd
 try:
     from .config import CARD_SET
@@ -8,6 +9,36 @@ except ImportError:
     # Fallback for direct file loading
     from src.config import CARD_SET
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional; the NumPy path below is used without it
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _flags(codes, start_x, success_codes, fail_codes, card_codes):
+        """Row-parallel result/zone flags over integer result codes"""
+        n = codes.shape[0]
+        is_success = np.zeros(n, dtype=np.bool_)
+        is_fail = np.zeros(n, dtype=np.bool_)
+        is_card = np.zeros(n, dtype=np.bool_)
+        in_def_third = np.zeros(n, dtype=np.bool_)
+        for i in prange(n):
+            code = codes[i]
+            for c in success_codes:
+                if code == c:
+                    is_success[i] = True
+            for c in fail_codes:
+                if code == c:
+                    is_fail[i] = True
+            for c in card_codes:
+                if code == c:
+                    is_card[i] = True
+            in_def_third[i] = start_x[i] <= 35
+        return is_success, is_fail, is_card, in_def_third
+
 
 def preprocess_events(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -19,17 +50,41 @@ def preprocess_events(df: pd.DataFrame) -> pd.DataFrame:
     - in_def_third flag
     - Time sorting
     """
-    df = df.copy()
+    # Time sorting (for time-based analysis); lexsort keys are last-to-first
+    order = np.lexsort((
+        df["action_id"].to_numpy(),
+        df["time_seconds"].to_numpy(),
+        df["period_id"].to_numpy(),
+        df["game_id"].to_numpy(),
+    ))
+    df = df.take(order).reset_index(drop=True)
+    
+    # Result flags compare integer category codes instead of strings
+    result = pd.Categorical(df["result_name"])
+    codes = result.codes
+    
+    def result_codes(names):
+        # Drop -1 (name absent) so it never matches missing results (code -1)
+        found = result.categories.get_indexer(list(names))
+        return found[found >= 0]
     
-    # Time sorting (for time-based analysis)
-    df = df.sort_values(["game_id", "period_id", "time_seconds", "action_id"]).reset_index(drop=True)
+    if njit is not None:
+        flags = _flags(
+            codes,
+            df["start_x"].to_numpy(dtype=np.float64),
+            result_codes(["Successful"]),
+            result_codes(["Unsuccessful"]),
+            result_codes(CARD_SET),
+        )
+        df["is_success"], df["is_fail"], df["is_card"], df["in_def_third"] = flags
+        return df
     
     # Success/fail flags
-    df["is_success"] = df["result_name"] == "Successful"
-    df["is_fail"] = df["result_name"] == "Unsuccessful"
+    df["is_success"] = np.isin(codes, result_codes(["Successful"]))
+    df["is_fail"] = np.isin(codes, result_codes(["Unsuccessful"]))
     
     # Card flag
-    df["is_card"] = df["result_name"].isin(CARD_SET)
+    df["is_card"] = np.isin(codes, result_codes(CARD_SET))
     
     # Defensive third (start_x <= 35)
     df["in_def_third"] = df["start_x"] <= 35
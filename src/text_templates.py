@@ -1,15 +1,14 @@
 """
 Text generation templates for award descriptions
 """
-from .config import AWARDS
+from typing import Optional
 
+from .config import AWARDS_BY_ID, Award
 
-def get_award_info(award_id: str) -> dict:
+
+def get_award_info(award_id: str) -> Optional[Award]:
     """Get award configuration by ID"""
-    for award in AWARDS:
-        if award["id"] == award_id:
-            return award
-    return None
+    return AWARDS_BY_ID.get(award_id)
 
 
 def generate_player_description(player_name: str, team_name: str, award_id: str, 
@@ -22,8 +21,8 @@ def generate_player_description(player_name: str, team_name: str, award_id: str,
     if not award_info:
         return f"{player_name} 선수가 수상했습니다!"
     
-    award_title = award_info["title"]
-    icon = award_info.get("icon", "🏆")
+    award_title = award_info.title
+    icon = award_info.icon
     
     # Base message
     if rank == 1:
@@ -38,8 +37,8 @@ def generate_player_description(player_name: str, team_name: str, award_id: str,
     message = f"{icon} **{award_title}** {rank_text}\n\n"
     message += f"{player_name} ({team_name}) 선수는 {award_title}에서 "
     message += f"점수 {score:.3f}을 기록하여 상위 {percentile:.1f}%에 위치했습니다.\n\n"
-    message += f"**설명**: {award_info['description']}\n\n"
-    message += f"**공식**: `{award_info['formula']}`"
+    message += f"**설명**: {award_info.description}\n\n"
+    message += f"**공식**: `{award_info.formula}`"
     
     # Add specific stats if available
     if stats:
@@ -62,8 +61,8 @@ def generate_award_card_html(player_name: str, team_name: str, award_id: str,
     if not award_info:
         return ""
     
-    icon = award_info.get("icon", "🏆")
-    title = award_info["title"]
+    icon = award_info.icon
+    title = award_info.title
     
     # Rank emoji
     if rank == 1:
@@ -1,9 +1,44 @@
 """
 Reusable UI components for sports magazine style Streamlit app
 """
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+
 import streamlit as st
 
 
+@lru_cache(maxsize=4096)
+def escape_html(value) -> str:
+    """HTML-escape a data-derived string (player/team names), memoized per value"""
+    return escape(str(value))
+
+
+# Podium rank lookups (index = rank - 1)
+_RANK_EMOJI = ("🥇", "🥈", "🥉")
+_RANK_CLASS = ("badge-rank-1", "badge-rank-2", "badge-rank-3")
+
+
+def _rank_badge(rank: int):
+    """(emoji, css class) for a rank badge; ranks past the podium show '#N'"""
+    if 1 <= rank <= 3:
+        return _RANK_EMOJI[rank - 1], _RANK_CLASS[rank - 1]
+    return f"#{rank}", "badge-rank"
+
+
+# Complete podium badge spans, formatted once at import
+_RANK_BADGE_HTML = tuple(
+    f'<span class="badge {cls}">{emoji}</span>' for cls, emoji in zip(_RANK_CLASS, _RANK_EMOJI)
+)
+
+
+def _rank_badge_html(rank: int) -> str:
+    """<span> badge for a rank; podium ranks reuse the prebuilt spans"""
+    if 1 <= rank <= 3:
+        return _RANK_BADGE_HTML[rank - 1]
+    return f'<span class="badge badge-rank">#{rank}</span>'
+
+
 def render_sidebar_toggle():
     """Render sidebar toggle button and manage sidebar state"""
     # Initialize sidebar state
@@ -51,21 +86,14 @@ def render_sidebar_toggle():
             st.rerun()
 
 
-def inject_custom_css():
-    """Inject custom dark theme CSS with dynamic sidebar display"""
-    # Determine sidebar display state
-    sidebar_open = st.session_state.get('sidebar_open', True)
-    sidebar_display = "block" if sidebar_open else "none"
-    sidebar_visibility = "visible" if sidebar_open else "hidden"
-    margin_left = 300 if sidebar_open else 0
-    
-    css_content = """
+# Theme stylesheet is edited in static/theme.css and inlined, minified, from
+# static/theme.min.css (regenerate with scripts/minify_css.py) as a <style> block.
+# It is not linked via enableStaticServing: older Streamlit releases serve .css
+# from /app/static as text/plain with nosniff, so browsers drop the stylesheet
+_THEME_CSS_PATH = Path(__file__).resolve().parent.parent / "static" / "theme.min.css"
+
+_SIDEBAR_CSS_TEMPLATE = """
     <style>
-        /* Dark Theme Base */
-        .stApp {{
-            background-color: #0e1117;
-        }}
-        
         /* Force sidebar display state */
         [data-testid="stSidebar"] {{
             display: {sidebar_display} !important;
@@ -94,320 +122,65 @@ def inject_custom_css():
             margin-left: {margin_left}px !important;
             transition: all 0.3s ease !important;
         }}
-        
-        /* Hide default Streamlit elements */
-        #MainMenu {{visibility: hidden;}}
-        footer {{visibility: hidden;}}
-        header {{visibility: hidden;}}
-        
-        /* Typography */
-        h1, h2, h3 {{
-            color: #f8f9fa !important;
-            font-weight: 700;
-        }}
-        
-        /* Card Styles */
-        .award-card {{
-            background: linear-gradient(135deg, #161b22 0%, #1c2128 100%);
-            border: 1px solid #30363d;
-            border-radius: 20px;
-            padding: 24px;
-            margin: 16px 0;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        
-        .award-card:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 8px 12px rgba(0, 0, 0, 0.4);
-            border-color: #facc15;
-        }}
-        
-        .award-card-large {{
-            background: linear-gradient(135deg, #161b22 0%, #1c2128 100%);
-            border: 2px solid #30363d;
-            border-radius: 24px;
-            padding: 32px;
-            margin: 20px 0;
-            box-shadow: 0 6px 12px rgba(0, 0, 0, 0.4);
-        }}
-        
-        .award-title {{
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #facc15;
-            margin-bottom: 12px;
-        }}
-        
-        .award-title-large {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #facc15;
-            margin-bottom: 16px;
-        }}
-        
-        .award-player {{
-            font-size: 1.25rem;
-            font-weight: 600;
-            color: #f8f9fa;
-            margin: 8px 0;
-        }}
-        
-        .award-team {{
-            font-size: 1rem;
-            color: #8b949e;
-            margin-bottom: 16px;
-        }}
-        
-        .award-metric {{
-            font-size: 3rem;
-            font-weight: 800;
-            color: #facc15;
-            margin: 16px 0;
-            line-height: 1;
-        }}
-        
-        .award-metric-label {{
-            font-size: 0.9rem;
-            color: #8b949e;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-top: 8px;
-        }}
-        
-        .award-subtext {{
-            font-size: 0.95rem;
-            color: #c9d1d9;
-            margin-top: 12px;
-            line-height: 1.6;
-        }}
-        
-        .badge {{
-            display: inline-block;
-            padding: 6px 12px;
-            border-radius: 12px;
-            font-size: 0.85rem;
-            font-weight: 700;
-            margin-right: 8px;
-        }}
-        
-        .badge-rank-1 {{
-            background: linear-gradient(135deg, #facc15 0%, #eab308 100%);
-            color: #0e1117;
-        }}
-        
-        .badge-rank-2 {{
-            background: linear-gradient(135deg, #94a3b8 0%, #64748b 100%);
-            color: #ffffff;
-        }}
-        
-        .badge-rank-3 {{
-            background: linear-gradient(135deg, #f97316 0%, #ea580c 100%);
-            color: #ffffff;
-        }}
-        
-        .badge-rank {{
-            background: #30363d;
-            color: #f8f9fa;
-        }}
-        
-        .badge-percentile {{
-            background: #21262d;
-            color: #58a6ff;
-            border: 1px solid #30363d;
-        }}
-        
-        /* Hero Section */
-        .hero-section {{
-            text-align: center;
-            padding: 60px 20px 40px;
-            background: linear-gradient(180deg, #0e1117 0%, #161b22 100%);
-            border-bottom: 2px solid #30363d;
-            margin-bottom: 40px;
-        }}
-        
-        .hero-title {{
-            font-size: 3.5rem;
-            font-weight: 900;
-            color: #facc15;
-            margin-bottom: 16px;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.5);
-        }}
-        
-        .hero-subtitle {{
-            font-size: 1.3rem;
-            color: #8b949e;
-            max-width: 800px;
-            margin: 0 auto;
-            line-height: 1.8;
-        }}
-        
-        /* Profile Section */
-        .profile-header {{
-            background: linear-gradient(135deg, #161b22 0%, #1c2128 100%);
-            border-radius: 24px;
-            padding: 40px;
-            margin-bottom: 32px;
-            border: 2px solid #30363d;
-        }}
-        
-        .profile-name {{
-            font-size: 2.5rem;
-            font-weight: 800;
-            color: #f8f9fa;
-            margin-bottom: 8px;
-        }}
-        
-        .profile-team {{
-            font-size: 1.3rem;
-            color: #8b949e;
-            margin-bottom: 24px;
-        }}
-        
-        .profile-summary {{
-            font-size: 1.1rem;
-            color: #c9d1d9;
-            line-height: 1.8;
-            padding: 20px;
-            background: #0e1117;
-            border-radius: 12px;
-            border-left: 4px solid #facc15;
-        }}
-        
-        /* Stats Grid */
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 16px;
-            margin: 24px 0;
-        }}
-        
-        .stat-card {{
-            background: #161b22;
-            border: 1px solid #30363d;
-            border-radius: 16px;
-            padding: 20px;
-            text-align: center;
-        }}
-        
-        .stat-value {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #facc15;
-            margin-bottom: 4px;
-        }}
-        
-        .stat-label {{
-            font-size: 0.9rem;
-            color: #8b949e;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-        
-        /* Comparison Card */
-        .comparison-card {{
-            background: #161b22;
-            border: 1px solid #30363d;
-            border-radius: 16px;
-            padding: 20px;
-            margin: 12px 0;
-        }}
-        
-        .comparison-label {{
-            font-size: 0.85rem;
-            color: #8b949e;
-            text-transform: uppercase;
-            margin-bottom: 8px;
-        }}
-        
-        .comparison-value {{
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #f8f9fa;
-        }}
-        
-        .comparison-diff {{
-            font-size: 0.9rem;
-            margin-top: 4px;
-        }}
-        
-        .comparison-diff.positive {{
-            color: #3fb950;
-        }}
-        
-        .comparison-diff.negative {{
-            color: #f85149;
-        }}
-        
-        /* Expandable Section */
-        .expandable {{
-            margin-top: 16px;
-            padding-top: 16px;
-            border-top: 1px solid #30363d;
-        }}
-        
-        .expandable-content {{
-            font-size: 0.9rem;
-            color: #8b949e;
-            line-height: 1.6;
-        }}
-        
-        /* Section Title */
-        .section-title {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #f8f9fa;
-            margin: 40px 0 24px;
-            padding-bottom: 16px;
-            border-bottom: 2px solid #30363d;
-        }}
-        
-        /* Formula Box */
-        .formula-box {{
-            background: #0e1117;
-            border: 1px solid #30363d;
-            border-left: 4px solid #facc15;
-            border-radius: 8px;
-            padding: 16px;
-            margin: 16px 0;
-            font-family: 'Courier New', monospace;
-            color: #c9d1d9;
-        }}
-        
-        /* Comparison colors */
-        .worse {{
-            color: #f85149 !important;
-            font-weight: 800;
-        }}
-        
-        .better {{
-            color: #3fb950 !important;
-            font-weight: 800;
-        }}
-        
-        .neutral {{
-            color: #8b949e !important;
-            font-weight: 700;
-        }}
     </style>
-    """.format(
-        sidebar_display=sidebar_display,
-        sidebar_visibility=sidebar_visibility,
-        margin_left=margin_left
+    """
+
+
+@st.cache_resource
+def _css_payload(sidebar_open: bool) -> str:
+    """Theme plus sidebar <style> blobs, read and formatted once per sidebar state"""
+    theme_css = _THEME_CSS_PATH.read_text(encoding="utf-8")
+    return f"<style>{theme_css}</style>" + _SIDEBAR_CSS_TEMPLATE.format(
+        sidebar_display="block" if sidebar_open else "none",
+        sidebar_visibility="visible" if sidebar_open else "hidden",
+        margin_left=300 if sidebar_open else 0
     )
-    
-    st.markdown(css_content, unsafe_allow_html=True)
+
+
+def inject_custom_css():
+    """Inject custom dark theme CSS with dynamic sidebar display"""
+    st.markdown(_css_payload(st.session_state.get('sidebar_open', True)), unsafe_allow_html=True)
 
 
 
+# Static head fragments for the str.join card builders below
+_AWARD_CARD_HEAD = '<div class="{card_class}"><div class="{title_class}">'
+_METRIC_COMPARISON_HEAD = (
+    '<div class="award-card" style="margin-bottom: 20px;">'
+    '<div class="award-title" style="margin-bottom: 20px; text-align: center;">'
+)
+_METRIC_GRID_OPEN = (
+    '<div style="display: grid; grid-template-columns: 1fr auto 1fr; gap: 20px; align-items: center;">'
+)
+# worse_side -> (left, right) score classes for render_metric_comparison
+_SIDE_CLASSES = {
+    "left": ("worse", "better"),
+    "right": ("better", "worse"),
+    "tie": ("neutral", "neutral"),
+}
+_METRIC_VS = (
+    '<div style="text-align: center; font-size: 1.5rem; color: #8b949e; font-weight: 700;">vs</div>'
+)
+
+
+def _metric_side(score: float, percentile: float, rank: int, side_class: str) -> list:
+    """One player's column of the metric comparison card, as join fragments"""
+    score_text = f"{score:.3f}"
+    return [
+        '<div style="text-align: center;"><div class="award-metric ', side_class,
+        '" style="font-size: 2.5rem;">', score_text,
+        '</div><div style="margin-top: 12px;">', _rank_badge_html(rank),
+        ' <span class="badge badge-percentile">상위 ', f"{percentile:.0f}",
+        '%</span></div><div class="award-subtext" style="margin-top: 8px; font-size: 0.9rem;">점수: ',
+        score_text, '</div></div>',
+    ]
+
+
 def render_award_card(award_icon: str, award_title: str, player_name: str, 
                      team_name: str, metric_value: float, metric_label: str,
                      rank: int, percentile: float = None, description: str = None,
                      is_large: bool = False):
     """Render a single award card"""
-    rank_emoji = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else f"#{rank}"
-    rank_class = "badge-rank-1" if rank == 1 else "badge-rank-2" if rank == 2 else "badge-rank-3" if rank == 3 else "badge-rank"
-    
     title_class = "award-title-large" if is_large else "award-title"
     card_class = "award-card-large" if is_large else "award-card"
     
@@ -419,29 +192,24 @@ def render_award_card(award_icon: str, award_title: str, player_name: str,
     if description:
         description_html = f'<div class="award-subtext">{description}</div>'
     
-    html = f"""
-    <div class="{card_class}">
-        <div class="{title_class}">
-            {award_icon} {award_title}
-        </div>
-        <div class="award-player">{player_name}</div>
-        <div class="award-team">{team_name}</div>
-        <div class="award-metric">{metric_value:.3f}</div>
-        <div class="award-metric-label">{metric_label}</div>
-        <div style="margin-top: 16px;">
-            <span class="badge {rank_class}">{rank_emoji}</span>
-            {percentile_html}
-        </div>
-        {description_html}
-    </div>
-    """
-    return html
+    return "".join([
+        _AWARD_CARD_HEAD.format(card_class=card_class, title_class=title_class),
+        str(award_icon), " ", str(award_title),
+        '</div><div class="award-player">', escape_html(player_name),
+        '</div><div class="award-team">', escape_html(team_name),
+        '</div><div class="award-metric">', f"{metric_value:.3f}",
+        '</div><div class="award-metric-label">', str(metric_label),
+        '</div><div style="margin-top: 16px;">', _rank_badge_html(rank), ' ',
+        percentile_html,
+        '</div>', description_html,
+        '</div>',
+    ])
 
 
 def render_small_award_card(award_icon: str, award_title: str, player_name: str,
                            team_name: str, rank: int, score: float):
     """Render a compact award card for lists"""
-    rank_emoji = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else f"#{rank}"
+    rank_emoji, _ = _rank_badge(rank)
     
     html = f"""
     <div class="award-card" style="padding: 16px;">
@@ -451,10 +219,10 @@ def render_small_award_card(award_icon: str, award_title: str, player_name: str,
                     {award_icon} {award_title}
                 </div>
                 <div style="font-size: 1rem; color: #f8f9fa; font-weight: 500;">
-                    {player_name}
+                    {escape_html(player_name)}
                 </div>
                 <div style="font-size: 0.85rem; color: #8b949e; margin-top: 4px;">
-                    {team_name}
+                    {escape_html(team_name)}
                 </div>
             </div>
             <div style="text-align: right;">
@@ -486,8 +254,8 @@ def render_profile_header(player_name: str, team_name: str, summary: str):
     """Render player profile header"""
     html = f"""
     <div class="profile-header">
-        <div class="profile-name">{player_name}</div>
-        <div class="profile-team">{team_name}</div>
+        <div class="profile-name">{escape_html(player_name)}</div>
+        <div class="profile-team">{escape_html(team_name)}</div>
         <div class="profile-summary">{summary}</div>
     </div>
     """
@@ -505,6 +273,26 @@ def render_stat_card(value: str, label: str):
     return html
 
 
+def render_card_grid(cards: list, columns: int = 2, gap: int = 12):
+    """Render card HTML snippets as one CSS grid (a single markdown element)"""
+    # Cards are stripped so no blank line ends the HTML block mid-grid
+    cards_html = "".join(card.strip() for card in cards)
+    html = (
+        f'<div style="display: grid; grid-template-columns: repeat({columns}, 1fr); gap: {gap}px;">'
+        f'{cards_html}</div>'
+    )
+    return html
+
+
+def render_award_grid(html_chunks: list, columns: int = 1, gap: int = 12):
+    """Emit card HTML snippets with ONE st.markdown call (one Streamlit block)"""
+    if columns > 1:
+        html = render_card_grid(html_chunks, columns=columns, gap=gap)
+    else:
+        html = "".join(chunk.strip() for chunk in html_chunks)
+    st.markdown(html, unsafe_allow_html=True)
+
+
 def render_comparison_card(label: str, team_value: float, league_value: float, unit: str = ""):
     """Render team vs league comparison card"""
     diff = team_value - league_value
@@ -534,10 +322,10 @@ def render_player_vs_header(player1_name: str, player1_team: str,
         <div style="display: grid; grid-template-columns: 1fr auto 1fr; align-items: center; gap: 20px;">
             <div>
                 <div class="award-player" style="font-size: 1.5rem; margin-bottom: 8px;">
-                    {player1_name}
+                    {escape_html(player1_name)}
                 </div>
                 <div class="award-team" style="font-size: 1rem;">
-                    {player1_team if player1_team else ""}
+                    {escape_html(player1_team) if player1_team else ""}
                 </div>
             </div>
             <div style="font-size: 2rem; font-weight: 900; color: #facc15;">
@@ -545,10 +333,10 @@ def render_player_vs_header(player1_name: str, player1_team: str,
             </div>
             <div>
                 <div class="award-player" style="font-size: 1.5rem; margin-bottom: 8px;">
-                    {player2_name}
+                    {escape_html(player2_name)}
                 </div>
                 <div class="award-team" style="font-size: 1rem;">
-                    {player2_team if player2_team else ""}
+                    {escape_html(player2_team) if player2_team else ""}
                 </div>
             </div>
         </div>
@@ -562,59 +350,15 @@ def render_metric_comparison(award_title: str, award_icon: str,
                             player2_score: float, player2_percentile: float, player2_rank: int,
                             worse_side: str = "tie"):
     """Render metric comparison card for two players"""
-    # Determine colors
-    if worse_side == "left":
-        left_class = "worse"
-        right_class = "better"
-    elif worse_side == "right":
-        left_class = "better"
-        right_class = "worse"
-    else:
-        left_class = "neutral"
-        right_class = "neutral"
-    
-    # Rank badges
-    rank1_emoji = "🥇" if player1_rank == 1 else "🥈" if player1_rank == 2 else "🥉" if player1_rank == 3 else f"#{player1_rank}"
-    rank2_emoji = "🥇" if player2_rank == 1 else "🥈" if player2_rank == 2 else "🥉" if player2_rank == 3 else f"#{player2_rank}"
-    
-    rank1_class = "badge-rank-1" if player1_rank == 1 else "badge-rank-2" if player1_rank == 2 else "badge-rank-3" if player1_rank == 3 else "badge-rank"
-    rank2_class = "badge-rank-2" if player2_rank == 1 else "badge-rank-2" if player2_rank == 2 else "badge-rank-3" if player2_rank == 3 else "badge-rank"
+    # Determine colors (anything other than left/right renders as a tie)
+    left_class, right_class = _SIDE_CLASSES.get(worse_side, _SIDE_CLASSES["tie"])
     
-    html = f"""
-    <div class="award-card" style="margin-bottom: 20px;">
-        <div class="award-title" style="margin-bottom: 20px; text-align: center;">
-            {award_icon} {award_title}
-        </div>
-        <div style="display: grid; grid-template-columns: 1fr auto 1fr; gap: 20px; align-items: center;">
-            <div style="text-align: center;">
-                <div class="award-metric {left_class}" style="font-size: 2.5rem;">
-                    {player1_score:.3f}
-                </div>
-                <div style="margin-top: 12px;">
-                    <span class="badge {rank1_class}">{rank1_emoji}</span>
-                    <span class="badge badge-percentile">상위 {player1_percentile:.0f}%</span>
-                </div>
-                <div class="award-subtext" style="margin-top: 8px; font-size: 0.9rem;">
-                    점수: {player1_score:.3f}
-                </div>
-            </div>
-            <div style="text-align: center; font-size: 1.5rem; color: #8b949e; font-weight: 700;">
-                vs
-            </div>
-            <div style="text-align: center;">
-                <div class="award-metric {right_class}" style="font-size: 2.5rem;">
-                    {player2_score:.3f}
-                </div>
-                <div style="margin-top: 12px;">
-                    <span class="badge {rank2_class}">{rank2_emoji}</span>
-                    <span class="badge badge-percentile">상위 {player2_percentile:.0f}%</span>
-                </div>
-                <div class="award-subtext" style="margin-top: 8px; font-size: 0.9rem;">
-                    점수: {player2_score:.3f}
-                </div>
-            </div>
-        </div>
-    </div>
-    """
-    return html
+    return "".join([
+        _METRIC_COMPARISON_HEAD, str(award_icon), " ", str(award_title), "</div>",
+        _METRIC_GRID_OPEN,
+        *_metric_side(player1_score, player1_percentile, player1_rank, left_class),
+        _METRIC_VS,
+        *_metric_side(player2_score, player2_percentile, player2_rank, right_class),
+        "</div></div>",
+    ])
 
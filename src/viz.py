@@ -1,60 +1,74 @@
 """
 Visualization utilities
 """
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
 
+# Shared layout for award charts: plotly_white plus the common size/legend.
+# Applied by name rather than as pio's global default so pitch and pattern
+# figures keep their own themes
+_kleague_template = go.layout.Template(pio.templates["plotly_white"])
+_kleague_template.layout.update(height=400, showlegend=False)
+pio.templates["kleague"] = _kleague_template
 
+
+def _empty_figure() -> go.Figure:
+    fig = go.Figure()
+    fig.add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5)
+    return fig
+
+
+# Figures are cached per (frame contents, award, options); callers pass small
+# per-award slices, so Streamlit's content hash is cheap
+@st.cache_data(show_spinner=False)
 def plot_award_distribution(df: pd.DataFrame, award_id: str, award_title: str, metric_col: str = "score") -> go.Figure:
     """
     Create histogram/boxplot of award scores
     """
-    award_data = df[df["award_id"] == award_id].copy()
+    award_data = df[df["award_id"] == award_id]
+    # NaN scores are skipped (np.histogram cannot range over them)
+    values = award_data[metric_col].dropna().to_numpy()
+    if len(values) == 0:
+        return _empty_figure()
     
-    if len(award_data) == 0:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5)
-        return fig
-    
-    fig = px.histogram(
-        award_data,
-        x=metric_col,
-        nbins=30,
-        title=f"{award_title} - Score Distribution",
-        labels={metric_col: "Score", "count": "Number of Players"}
-    )
+    # Bin in NumPy and draw bars directly; skips plotly-express's frame handling
+    counts, edges = np.histogram(values, bins=30)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges)
+    ))
     
     fig.update_layout(
-        showlegend=False,
-        height=400,
-        template="plotly_white"
+        title=f"{award_title} - Score Distribution",
+        xaxis_title="Score",
+        yaxis_title="Number of Players",
+        template="kleague"
     )
     
     return fig
 
 
+@st.cache_data(show_spinner=False)
 def plot_award_ranking(df: pd.DataFrame, award_id: str, award_title: str, top_n: int = 20) -> go.Figure:
     """
     Create bar chart of top N players for an award
     """
-    award_data = df[df["award_id"] == award_id].copy()
-    top_data = award_data.nsmallest(top_n, "rank") if len(award_data) > 0 else pd.DataFrame()
-    
-    if len(top_data) == 0:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available", xref="paper", yref="paper", x=0.5, y=0.5)
-        return fig
-    
-    # Sort by rank
-    top_data = top_data.sort_values("rank")
+    award_data = df[df["award_id"] == award_id]
+    if len(award_data) == 0:
+        return _empty_figure()
+    # nsmallest already returns rows in ascending rank order
+    top_data = award_data.nsmallest(top_n, "rank")
     
     fig = go.Figure(data=[
         go.Bar(
             x=top_data["score"],
-            y=top_data["player_name_ko"] + " (" + top_data["team_name_ko"] + ")",
+            y=top_data["player_name_ko"].str.cat(top_data["team_name_ko"].astype(str), sep=" (") + ")",
             orientation="h",
-            text=[f"#{int(r)}" for r in top_data["rank"]],
+            text=("#" + top_data["rank"].astype(int).astype(str)).tolist(),
             textposition="outside"
         )
     ])
@@ -64,7 +78,7 @@ def plot_award_ranking(df: pd.DataFrame, award_id: str, award_title: str, top_n:
         xaxis_title="Score",
         yaxis_title="Player",
         height=max(400, len(top_data) * 30),
-        template="plotly_white",
+        template="kleague",
         yaxis={"categoryorder": "total ascending"}
     )
     